@@ -1,11 +1,15 @@
 from config.cors_config import CORSConfig
 from config.database_config import DatabaseConfig
+from config.json_config import JSONConfig
 from config.logging_config import ConsoleLoggingConfig, FileLoggingConfig
-from controller import register_blueprints
+from concurrent.futures import ThreadPoolExecutor
+from controller import load_blueprints, register_blueprints
 from exception.handlers import ErrorHandlerRegistry
 from flask import Flask
 import logging
 
+_logger = logging.getLogger('app')
+
 def create_app(debug=False) -> Flask:
     """Cria e configura a instância da aplicação Flask."""
     app = Flask(__name__)
@@ -16,15 +20,25 @@ def create_app(debug=False) -> Flask:
     if not app.debug:
         FileLoggingConfig.setup_file_logging()
     
-    # Inicialização do banco de dados e CORS
-    DatabaseConfig.init_app(app)
-    CORSConfig.init_cors(app)
-    
-    # Registro de handlers de exceção e rotas
-    ErrorHandlerRegistry(app)
-    register_blueprints(app)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Os controladores (e seus serviços e repositórios) são importados e construídos em
+        # segundo plano enquanto o banco de dados é inicializado
+        blueprints = executor.submit(load_blueprints)
+
+        # Inicialização do banco de dados, CORS e serialização JSON
+        DatabaseConfig.init_app(app)
+        CORSConfig.init_cors(app)
+        JSONConfig.init_json(app)
+
+        # Registro de handlers de exceção e rotas
+        ErrorHandlerRegistry(app)
+        blueprints.result()  # Propaga eventuais erros da construção dos blueprints
+        register_blueprints(app)
+
+    # Compila o mapa de URLs já na inicialização, em vez de na primeira requisição
+    app.url_map.update()
 
-    logging.getLogger('app').info("Configuração da aplicação concluída")
+    _logger.info("Configuração da aplicação concluída")
     return app
 
 if __name__ == '__main__':
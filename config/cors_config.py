@@ -1,4 +1,3 @@
-from flask_cors import CORS
 import logging
 
 class CORSConfig:
@@ -14,8 +13,10 @@ class CORSConfig:
             podem ser acessados via CORS.
     """
 
-    @staticmethod
-    def init_cors(app, origins="*", resources=None):
+    _logger = logging.getLogger('CORSConfig')
+
+    @classmethod
+    def init_cors(cls, app, origins="*", resources=None):
         """
         Inicializa e configura o CORS para a aplicação Flask.
 
@@ -30,8 +31,13 @@ class CORSConfig:
         Exemplo de uso:
             CORSConfig.init_cors(app, origins=["https://example.com"], resources={r"/api/*": {"origins": "https://example.com"}})
         """
-        if resources is None:
-            resources = {r"/*": {"origins": origins}}
-        
-        CORS(app, resources=resources)
-        logging.getLogger("CORSConfig").info(f"CORS configurado com origins: {origins}")
\ No newline at end of file
+        from flask_cors import CORS  # Importado sob demanda para não pesar na carga do módulo
+
+        if resources is None and origins == "*":
+            # Configuração padrão do flask_cors: todas as origens em todos os caminhos
+            CORS(app)
+        else:
+            if resources is None:
+                resources = {r"/*": {"origins": origins}}
+            CORS(app, resources=resources)
+        cls._logger.info("CORS configurado com origins: %s", origins)
\ No newline at end of file
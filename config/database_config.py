@@ -1,7 +1,13 @@
 from config.globals import db
+from importlib import import_module
+from pathlib import Path
+from sqlalchemy import String, event, inspect, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from typing import Optional
+import hashlib
 import logging
-import os
 
 class DatabaseConfig:
     """
@@ -11,10 +17,18 @@ class DatabaseConfig:
     garantia de que o diretório onde o banco de dados será salvo exista.
 
     Atributos da Classe:
-        BASE_DIR (str): Diretório base onde o arquivo da configuração está localizado.
-        DATABASE_DIR (str): Caminho completo para o diretório onde o banco de dados será armazenado.
+        BASE_DIR (Path): Diretório base onde o arquivo da configuração está localizado.
+        DATABASE_DIR (Path): Caminho completo para o diretório onde o banco de dados será armazenado.
         DATABASE_NAME (str): Nome do arquivo do banco de dados.
         DATABASE_ENGINE (str): Tipo de motor de banco de dados a ser utilizado. Padrão: 'sqlite'.
+        ENTITY_MODULES (tuple): Módulos das entidades que precisam estar carregados antes da criação das tabelas.
+        SCHEMA_HASH_FILE (str): Nome do arquivo, em DATABASE_DIR, com o hash do esquema já criado.
+        POOL_SIZE (int): Número de conexões mantidas abertas no pool.
+        POOL_MAX_OVERFLOW (int): Número de conexões extras permitidas além de POOL_SIZE em picos de uso.
+        POOL_TIMEOUT (int): Segundos de espera por uma conexão livre antes de falhar.
+        POOL_RECYCLE (int): Segundos após os quais uma conexão é reciclada.
+        STATEMENT_CACHE_SIZE (int): Número de instruções preparadas mantidas em cache por conexão.
+        SQLITE_PRAGMAS (tuple): Diretivas PRAGMA aplicadas a cada nova conexão com um banco SQLite em arquivo.
 
     Métodos da Classe:
         init_app(app):
@@ -24,19 +38,43 @@ class DatabaseConfig:
         get_database_uri():
             Retorna a URI de conexão do banco de dados de acordo com o motor especificado.
 
+        get_engine_options():
+            Retorna as opções do engine do SQLAlchemy, incluindo a configuração do pool de conexões.
+
+        _register_sqlite_pragmas(app):
+            Registra o evento que aplica `SQLITE_PRAGMAS` a cada nova conexão com o SQLite.
+
         _create_tables(app):
-            Cria todas as tabelas do banco de dados definidas na aplicação.
+            Cria todas as tabelas do banco de dados definidas na aplicação, caso o esquema tenha mudado
+            desde a última inicialização.
+
+        _migrate_legacy_hora():
+            Converte para minutos a coluna `horario.hora` de bancos criados quando ela era texto ('HH:MM').
 
         _ensure_database_directory_exists():
             Garante que o diretório onde o banco de dados será armazenado exista. Caso não exista, o diretório será criado.
     """
 
-    BASE_DIR: str = os.path.abspath(os.path.dirname(__file__))  # Diretório base
-    DATABASE_DIR: str = os.path.join(BASE_DIR, 'data')  # Diretório de dados
+    BASE_DIR: Path = Path(__file__).resolve().parent  # Diretório base
+    DATABASE_DIR: Path = BASE_DIR / 'data'  # Diretório de dados
     DATABASE_NAME: str = 'database.db'  # Nome do arquivo do banco de dados
     DATABASE_ENGINE: str = 'sqlite'  # Motor de banco de dados, aqui é 'sqlite' por padrão
+    ENTITY_MODULES: tuple = ('entity.horario', 'entity.materia', 'entity.professor', 'entity.turma')
+    SCHEMA_HASH_FILE: str = '.schema_hash'
+    POOL_SIZE: int = 10
+    POOL_MAX_OVERFLOW: int = 20
+    POOL_TIMEOUT: int = 30
+    POOL_RECYCLE: int = 1800  # 30 minutos
+    STATEMENT_CACHE_SIZE: int = 500
+    SQLITE_PRAGMAS: tuple = (
+        'journal_mode=WAL',  # Leitores não são bloqueados durante uma escrita
+        'synchronous=NORMAL',  # Seguro com WAL e evita um fsync a cada transação
+        'temp_store=MEMORY',
+        'mmap_size=268435456'  # 256 MB de I/O mapeado em memória
+    )
     
     _logger = logging.getLogger('DatabaseConfig')
+    _ready_dir: Optional[Path] = None  # Diretório já criado nesta execução
 
     @classmethod
     def init_app(cls, app):
@@ -56,13 +94,15 @@ class DatabaseConfig:
         cls._ensure_database_directory_exists()
         app.config['SQLALCHEMY_DATABASE_URI'] = cls.get_database_uri()
         app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = cls.get_engine_options()
 
         try:
             db.init_app(app)
+            cls._register_sqlite_pragmas(app)
             cls._create_tables(app)
             cls._logger.info("Configuração do banco de dados concluída com sucesso.")
         except SQLAlchemyError as e:
-            cls._logger.error(f"Erro ao inicializar o banco de dados: {e}")
+            cls._logger.error("Erro ao inicializar o banco de dados: %s", e)
             raise
 
     @classmethod
@@ -80,16 +120,105 @@ class DatabaseConfig:
             ValueError: Lança exceção se o motor de banco de dados não for suportado.
         """
         if cls.DATABASE_ENGINE == 'sqlite':
-            return f'sqlite:///{os.path.join(cls.DATABASE_DIR, cls.DATABASE_NAME)}'
+            if cls._is_in_memory():
+                return 'sqlite://'
+            return f'sqlite:///{cls._database_path()}'
         raise ValueError(f"Motor de banco de dados '{cls.DATABASE_ENGINE}' não suportado.")
 
+    @classmethod
+    def get_engine_options(cls) -> dict:
+        """
+        Constrói as opções do engine do SQLAlchemy.
+
+        As conexões são reutilizadas em ordem LIFO, mantendo poucas conexões "quentes" em períodos
+        de pouco tráfego, e verificadas antes do uso (pre-ping). No SQLite, as conexões do pool são
+        compartilhadas entre threads, por isso `check_same_thread` é desabilitado; um banco em memória
+        usa uma única conexão estática, pois cada nova conexão criaria um banco vazio.
+
+        Cada conexão SQLite guarda até `STATEMENT_CACHE_SIZE` instruções já preparadas, reaproveitadas
+        quando o mesmo SQL (gerado pelo cache de compilação do SQLAlchemy) é executado novamente. Como
+        uma conexão com um arquivo local não cai, o pre-ping, que custaria uma consulta a mais em cada
+        retirada do pool, é desabilitado no SQLite.
+
+        Retorna:
+            dict: As opções a serem usadas em `SQLALCHEMY_ENGINE_OPTIONS`.
+        """
+        if cls.DATABASE_ENGINE == 'sqlite' and cls._is_in_memory():
+            return {
+                'poolclass': StaticPool,
+                'connect_args': {'check_same_thread': False, 'cached_statements': cls.STATEMENT_CACHE_SIZE}
+            }
+
+        options = {
+            'pool_size': cls.POOL_SIZE,
+            'max_overflow': cls.POOL_MAX_OVERFLOW,
+            'pool_timeout': cls.POOL_TIMEOUT,
+            'pool_recycle': cls.POOL_RECYCLE,
+            'pool_pre_ping': True,
+            'pool_use_lifo': True
+        }
+        if cls.DATABASE_ENGINE == 'sqlite':
+            options['pool_pre_ping'] = False
+            options['connect_args'] = {'check_same_thread': False, 'cached_statements': cls.STATEMENT_CACHE_SIZE}
+        return options
+
+    @classmethod
+    def _register_sqlite_pragmas(cls, app):
+        """
+        Registra no engine da aplicação um evento que aplica `SQLITE_PRAGMAS` a cada nova conexão.
+
+        O modo WAL permite que as leituras prossigam enquanto outra thread escreve, em vez de
+        serializar todo o acesso ao arquivo. Bancos em memória não usam o journal em disco e são ignorados.
+
+        Parâmetros:
+            app (Flask): A instância da aplicação Flask, já registrada no SQLAlchemy.
+        """
+        if cls.DATABASE_ENGINE != 'sqlite' or cls._is_in_memory():
+            return
+
+        with app.app_context():
+            engine = db.engine
+        if not event.contains(engine, 'connect', cls._apply_sqlite_pragmas):
+            event.listen(engine, 'connect', cls._apply_sqlite_pragmas)
+
+    @classmethod
+    def _apply_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        """
+        Executa as diretivas de `SQLITE_PRAGMAS` em uma conexão recém-aberta.
+
+        Parâmetros:
+            dbapi_connection: A conexão DBAPI (sqlite3) recém-criada.
+            connection_record: O registro da conexão no pool (não utilizado).
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in cls.SQLITE_PRAGMAS:
+                cursor.execute(f'PRAGMA {pragma}')
+        finally:
+            cursor.close()
+
+    @classmethod
+    def _is_in_memory(cls) -> bool:
+        """
+        Indica se o banco de dados SQLite configurado é um banco em memória.
+
+        Retorna:
+            bool: True se `DATABASE_NAME` for ':memory:'.
+        """
+        return cls.DATABASE_NAME == ':memory:'
+
     @classmethod
     def _create_tables(cls, app):
         """
         Cria as tabelas do banco de dados dentro do contexto da aplicação Flask.
 
-        Este método deve ser chamado após a configuração do SQLAlchemy. Ele garante que todas
-        as tabelas definidas nos modelos da aplicação sejam criadas no banco de dados.
+        Este método deve ser chamado após a configuração do SQLAlchemy. Ele importa os módulos
+        listados em `ENTITY_MODULES`, para que os modelos estejam registrados nos metadados, e garante
+        que todas as tabelas definidas nos modelos da aplicação sejam criadas no banco de dados.
+
+        A criação é ignorada quando a impressão digital do esquema (hash do DDL gerado a partir dos
+        metadados) é igual à gravada em `SCHEMA_HASH_FILE` na última inicialização e o arquivo do banco
+        ainda existe. Para forçar a verificação das tabelas, basta apagar esse arquivo.
 
         Parâmetros:
             app (Flask): A instância da aplicação Flask.
@@ -97,24 +226,179 @@ class DatabaseConfig:
         Exceções:
             SQLAlchemyError: Lança exceção caso ocorra um erro durante a criação das tabelas.
         """
+        for module_path in cls.ENTITY_MODULES:
+            import_module(module_path)
+
         with app.app_context():
+            schema_hash = cls._compute_schema_hash()
+            if cls._is_schema_up_to_date(schema_hash):
+                cls._logger.info("Esquema do banco de dados inalterado, criação das tabelas ignorada.")
+                return
+
             try:
                 db.create_all()
+                cls._migrate_legacy_hora()
+                cls._create_missing_indexes()
+                cls._write_schema_hash(schema_hash)
                 cls._logger.info("Tabelas criadas com sucesso!")
             except SQLAlchemyError as e:
-                cls._logger.error(f"Erro ao criar tabelas: {e}")
+                cls._remove_schema_hash()
+                cls._logger.error("Erro ao criar tabelas: %s", e)
                 raise
 
+    @classmethod
+    def _migrate_legacy_hora(cls):
+        """
+        Converte a coluna `horario.hora` de bancos criados quando ela ainda era texto no formato 'HH:MM'.
+
+        A hora passou a ser armazenada como minutos desde a meia-noite, mas o `create_all` não altera
+        tabelas existentes, e o SQLite não permite mudar o tipo de uma coluna: em um banco antigo, a
+        coluna continuaria sendo texto, misturando '10:00' com '450' e ordenando as horas como texto.
+        Por isso a tabela é recriada com o esquema atual e os horários são copiados, com as horas
+        convertidas em minutos (valores já gravados como minutos são mantidos). Como faz parte de
+        `_create_tables`, só é executado quando o esquema muda.
+
+        Exceções:
+            SQLAlchemyError: Lança exceção caso ocorra um erro durante a conversão; nada é alterado.
+        """
+        if cls.DATABASE_ENGINE != 'sqlite':
+            return
+        horario = db.metadata.tables['horario']
+        with db.engine.begin() as connection:
+            inspector = inspect(connection)
+            if not inspector.has_table('horario'):
+                return
+            legacy_columns = {column['name']: column['type'] for column in inspector.get_columns('horario')}
+            if not isinstance(legacy_columns.get('hora'), String):
+                return
+
+            # Os nomes dos índices são globais no SQLite: os da tabela antiga são removidos antes de recriá-la
+            for index in inspector.get_indexes('horario'):
+                connection.execute(text(f'DROP INDEX "{index["name"]}"'))
+            connection.execute(text('ALTER TABLE horario RENAME TO horario_legacy'))
+            horario.create(connection)
+
+            names = [column.name for column in horario.columns if column.name in legacy_columns]
+            values = [
+                "CASE WHEN instr(hora, ':') > 0"
+                " THEN CAST(substr(hora, 1, instr(hora, ':') - 1) AS INTEGER) * 60"
+                " + CAST(substr(hora, instr(hora, ':') + 1) AS INTEGER)"
+                " ELSE CAST(hora AS INTEGER) END" if name == 'hora' else f'"{name}"'
+                for name in names
+            ]
+            quoted_names = ', '.join(f'"{name}"' for name in names)
+            connection.execute(text(
+                f'INSERT INTO horario ({quoted_names}) SELECT {", ".join(values)} FROM horario_legacy'
+            ))
+            connection.execute(text('DROP TABLE horario_legacy'))
+        cls._logger.info("Coluna horario.hora convertida para minutos.")
+
+    @classmethod
+    def _create_missing_indexes(cls):
+        """
+        Cria os índices declarados nos modelos que ainda não existem no banco de dados.
+
+        O `create_all` só cria os índices junto com tabelas novas; este método garante que
+        índices adicionados a tabelas já existentes também sejam criados.
+
+        Exceções:
+            SQLAlchemyError: Lança exceção caso ocorra um erro durante a criação dos índices.
+        """
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=db.engine, checkfirst=True)
+
+    @classmethod
+    def _compute_schema_hash(cls) -> str:
+        """
+        Calcula o hash SHA-256 do DDL (tabelas e índices) gerado a partir dos metadados dos modelos.
+
+        Deve ser chamado dentro do contexto da aplicação, pois usa o dialeto do engine configurado.
+
+        Retorna:
+            str: O hash hexadecimal do esquema, precedido do nome do banco de dados.
+        """
+        dialect = db.engine.dialect
+        ddl = [cls.DATABASE_NAME]
+        for table in db.metadata.sorted_tables:
+            ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+            ddl.extend(sorted(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes))
+        return hashlib.sha256('\n'.join(ddl).encode()).hexdigest()
+
+    @classmethod
+    def _database_path(cls) -> Path:
+        """
+        Retorna o caminho do arquivo do banco de dados.
+
+        Retorna:
+            Path: Caminho completo do arquivo `DATABASE_NAME`.
+        """
+        return Path(cls.DATABASE_DIR) / cls.DATABASE_NAME
+
+    @classmethod
+    def _schema_hash_path(cls) -> Path:
+        """
+        Retorna o caminho do arquivo onde o hash do esquema é armazenado.
+
+        Retorna:
+            Path: Caminho completo do arquivo `SCHEMA_HASH_FILE`.
+        """
+        return Path(cls.DATABASE_DIR) / cls.SCHEMA_HASH_FILE
+
+    @classmethod
+    def _is_schema_up_to_date(cls, schema_hash: str) -> bool:
+        """
+        Verifica se as tabelas já foram criadas para o esquema atual.
+
+        Parâmetros:
+            schema_hash (str): O hash do esquema atual.
+
+        Retorna:
+            bool: True se o banco é um arquivo existente e o hash gravado é igual ao atual.
+        """
+        if cls._is_in_memory() or not cls._database_path().exists():
+            return False
+        try:
+            return cls._schema_hash_path().read_text(encoding='utf-8').strip() == schema_hash
+        except OSError:
+            return False
+
+    @classmethod
+    def _write_schema_hash(cls, schema_hash: str):
+        """
+        Grava o hash do esquema atual após a criação das tabelas.
+
+        Parâmetros:
+            schema_hash (str): O hash do esquema atual.
+        """
+        if cls._is_in_memory():
+            return
+        try:
+            cls._schema_hash_path().write_text(schema_hash, encoding='utf-8')
+        except OSError as e:
+            cls._logger.warning("Não foi possível gravar o hash do esquema: %s", e)
+
+    @classmethod
+    def _remove_schema_hash(cls):
+        """
+        Remove o hash do esquema gravado, forçando a criação das tabelas na próxima inicialização.
+        """
+        cls._schema_hash_path().unlink(missing_ok=True)
+
     @classmethod
     def _ensure_database_directory_exists(cls):
         """
         Garante que o diretório onde o banco de dados será armazenado exista.
 
         Se o diretório não existir, ele será criado. Isso é importante para garantir que o SQLite
-        possa salvar o banco de dados no local correto.
+        possa salvar o banco de dados no local correto. Depois de criado, o diretório é lembrado
+        e as inicializações seguintes da aplicação no mesmo processo não acessam o sistema de arquivos.
 
         Exceções:
             OSError: Lança exceção caso ocorra um erro ao criar o diretório.
         """
-        os.makedirs(cls.DATABASE_DIR, exist_ok=True)
-        cls._logger.info(f"Diretório {cls.DATABASE_DIR} pronto para uso.")
\ No newline at end of file
+        if cls._ready_dir == cls.DATABASE_DIR:
+            return
+        Path(cls.DATABASE_DIR).mkdir(parents=True, exist_ok=True)
+        cls._ready_dir = cls.DATABASE_DIR
+        cls._logger.info("Diretório %s pronto para uso.", cls.DATABASE_DIR)
\ No newline at end of file
@@ -1,3 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
\ No newline at end of file
+# Os objetos continuam carregados após o commit: os registros devolvidos por INSERT/UPDATE ... RETURNING
+# são serializados na resposta sem um novo SELECT. Cada requisição usa a sua própria sessão.
+db = SQLAlchemy(session_options={'expire_on_commit': False})
\ No newline at end of file
@@ -0,0 +1,69 @@
+from flask.json.provider import DefaultJSONProvider
+import logging
+import orjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Provedor JSON do Flask que serializa e desserializa com o orjson, implementado em C.
+
+    Herda do provedor padrão para reaproveitar a conversão de tipos não suportados nativamente
+    (`default`) e a montagem das respostas; apenas a codificação e a decodificação são trocadas.
+
+    Atributos:
+        sort_keys (bool): Se as chaves dos objetos devem ser ordenadas. Desabilitado por padrão,
+                          pois a ordem das chaves não faz parte do contrato da API.
+    """
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serializa o objeto para uma string JSON.
+
+        Args:
+            obj (Any): O objeto a ser serializado.
+            **kwargs: Argumentos do `json.dumps`, ignorados pelo orjson.
+
+        Returns:
+            str: O JSON gerado.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Desserializa uma string (ou bytes) JSON.
+
+        Args:
+            s (str | bytes): O JSON a ser lido.
+            **kwargs: Argumentos do `json.loads`, ignorados pelo orjson.
+
+        Returns:
+            Any: O objeto Python correspondente.
+        """
+        return orjson.loads(s)
+
+
+class JSONConfig:
+    """
+    Classe responsável por configurar a serialização JSON da aplicação Flask.
+
+    Métodos:
+        init_json(app):
+            Substitui o provedor JSON padrão da aplicação pelo OrjsonProvider, usado pelo `jsonify`
+            e pela leitura do corpo das requisições.
+    """
+
+    _logger = logging.getLogger('JSONConfig')
+
+    @classmethod
+    def init_json(cls, app):
+        """
+        Configura o OrjsonProvider como provedor JSON da aplicação.
+
+        Args:
+            app (Flask): Instância da aplicação Flask a ser configurada.
+        """
+        app.json = OrjsonProvider(app)
+        cls._logger.info("Provedor JSON configurado: %s", OrjsonProvider.__name__)
\ No newline at end of file
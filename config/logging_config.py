@@ -1,5 +1,8 @@
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+import atexit
 import logging
+import queue
 
 class BaseLoggingConfig:
     """
@@ -20,33 +23,89 @@ class BaseLoggingConfig:
         formatter = logging.Formatter(cls.LOG_FORMAT)
         handler.setFormatter(formatter)
         handler.setLevel(level or cls.LOG_LEVEL)
-        logging.getLogger().addHandler(handler)
-        logging.getLogger().setLevel(cls.LOG_LEVEL)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(handler)
+        root_logger.setLevel(cls.LOG_LEVEL)
 
 
 class ConsoleLoggingConfig(BaseLoggingConfig):
     """
     Configuração de logging para o console.
     """
+    _logger = logging.getLogger('ConsoleLoggingConfig')
+
     @classmethod
     def setup_console_logging(cls):
         """Configura logging para o console."""
         console_handler = logging.StreamHandler()
         cls.configure_logger(console_handler)
-        logging.getLogger('ConsoleLoggingConfig').info("Console logging configurado")
+        cls._logger.info("Console logging configurado")
+
+
+class DiscardingQueueHandler(QueueHandler):
+    """
+    Handler que enfileira os registros de log sem bloquear a thread que os emitiu.
+
+    Quando a fila está cheia, registros de nível INFO ou inferior são descartados;
+    registros mais graves aguardam espaço na fila para não serem perdidos.
+    """
+
+    def enqueue(self, record: logging.LogRecord):
+        """
+        Enfileira o registro, descartando-o se a fila estiver cheia e o nível for INFO ou inferior.
+
+        Args:
+            record (logging.LogRecord): O registro de log a ser enfileirado.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno > logging.INFO:
+                self.queue.put(record)
 
 
 class FileLoggingConfig(BaseLoggingConfig):
     """
     Configuração de logging para arquivo com rotação de arquivos.
+
+    A escrita em disco é feita por uma thread em segundo plano (QueueListener); as threads
+    que atendem as requisições apenas enfileiram os registros.
     """
     LOG_FILE_NAME: str = 'app.log'
     LOG_FILE_SIZE: int = 10 * 1024 * 1024  # 10 MB
     LOG_FILE_BACKUP: int = 5
+    LOG_QUEUE_SIZE: int = 10000  # Registros pendentes antes de descartar DEBUG/INFO
+
+    _logger = logging.getLogger('FileLoggingConfig')
+    _listener: Optional[QueueListener] = None
+    _queue_handler: Optional[QueueHandler] = None
+    _atexit_registered: bool = False  # O stop é registrado no atexit uma única vez por processo
 
     @classmethod
     def setup_file_logging(cls):
-        """Configura logging rotativo para arquivo."""
+        """Configura logging rotativo para arquivo, gravado de forma assíncrona."""
+        cls.stop()
         file_handler = RotatingFileHandler(cls.LOG_FILE_NAME, maxBytes=cls.LOG_FILE_SIZE, backupCount=cls.LOG_FILE_BACKUP)
-        cls.configure_logger(file_handler, level=logging.INFO)
-        logging.getLogger('FileLoggingConfig').info("File logging configurado")
\ No newline at end of file
+        log_queue = queue.Queue(cls.LOG_QUEUE_SIZE)
+        # O registro chega já formatado pelo DiscardingQueueHandler, por isso o handler de arquivo usa o formato padrão
+        cls._queue_handler = DiscardingQueueHandler(log_queue)
+        cls.configure_logger(cls._queue_handler, level=logging.INFO)
+
+        cls._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        cls._listener.start()
+        if not cls._atexit_registered:
+            atexit.register(cls.stop)
+            cls._atexit_registered = True
+        cls._logger.info("File logging configurado")
+
+    @classmethod
+    def stop(cls):
+        """Interrompe a thread de escrita, gravando os registros que ainda estão na fila, e fecha o arquivo de log."""
+        if cls._queue_handler is not None:
+            logging.getLogger().removeHandler(cls._queue_handler)
+            cls._queue_handler = None
+        if cls._listener is not None:
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.close()
+            cls._listener = None
@@ -1,32 +1,74 @@
-from .horario_controller import horario_blueprint
-from .professor_controller import professor_blueprint
-from .turma_controller import turma_blueprint
-from controller.materia_controller import materia_blueprint
+from flask import Blueprint
+from importlib import import_module
+from typing import List, Optional
+
+# Módulo do serviço, classe do serviço e nome do blueprint de cada controlador.
+# Os controladores são todos iguais ao BaseController, por isso são criados aqui
+# a partir desta tabela. A importação dos serviços é feita apenas durante o registro,
+# para que importar o pacote `controller` não carregue entidades, serviços e repositórios.
+CONTROLLERS = (
+    ('service.horario_service', 'HorarioService', 'horario'),
+    ('service.materia_service', 'MateriaService', 'materia'),
+    ('service.professor_service', 'ProfessorService', 'professor'),
+    ('service.turma_service', 'TurmaService', 'turma')
+)
+
+# Blueprints já construídos, reaproveitados por todas as instâncias da aplicação
+_blueprints: Optional[List[Blueprint]] = None
+
+def _make_blueprint(service_module: str, service_class: str, name: str) -> Blueprint:
+    """
+    Cria o controlador de uma entidade e retorna o seu blueprint.
+
+    A classe do controlador (por exemplo, `HorarioController`) é gerada como uma subclasse
+    de BaseController, mantendo o nome usado pelo logger do controlador.
+
+    Args:
+        service_module (str): Caminho do módulo onde o serviço está definido.
+        service_class (str): Nome da classe do serviço.
+        name (str): Nome do blueprint, também usado no prefixo das rotas.
+
+    Returns:
+        Blueprint: O blueprint com as rotas relacionadas à entidade.
+    """
+    from infrastructure.base_controller import BaseController
+
+    service = getattr(import_module(service_module), service_class)
+    controller_class = type(f'{name.title()}Controller', (BaseController,), {})
+    return controller_class(service, name).blueprint
+
+def load_blueprints() -> List[Blueprint]:
+    """
+    Importa os serviços e constrói os blueprints dos controladores uma única vez.
+
+    As chamadas seguintes devolvem a mesma lista, de modo que aplicações criadas várias
+    vezes no mesmo processo (por exemplo, uma por teste) não reconstroem os controladores.
+
+    Returns:
+        List[Blueprint]: Os blueprints de todas as entidades.
+    """
+    global _blueprints
+    if _blueprints is None:
+        _blueprints = [_make_blueprint(*controller) for controller in CONTROLLERS]
+    return _blueprints
 
 def register_blueprints(app):
     """
     Registra os blueprints das rotas no aplicativo Flask.
 
-    Esta função agrega todos os blueprints definidos para as diferentes entidades
-    (horário, matéria, professor, turma) e os registra no aplicativo Flask.
+    Esta função obtém os blueprints das diferentes entidades (horário, matéria, professor, turma),
+    construídos sob demanda por `load_blueprints`, e os registra no aplicativo Flask. Blueprints
+    já registrados no aplicativo são ignorados, tornando a função idempotente.
 
     Args:
         app (Flask): A instância do aplicativo Flask onde os blueprints serão registrados.
 
     Blueprints Registrados:
-        - horario_blueprint: Rotas relacionadas à entidade Horario.
-        - materia_blueprint: Rotas relacionadas à entidade Materia.
-        - professor_blueprint: Rotas relacionadas à entidade Professor.
-        - turma_blueprint: Rotas relacionadas à entidade Turma.
+        - horario: Rotas relacionadas à entidade Horario.
+        - materia: Rotas relacionadas à entidade Materia.
+        - professor: Rotas relacionadas à entidade Professor.
+        - turma: Rotas relacionadas à entidade Turma.
     """
-    # Lista contendo todos os blueprints a serem registrados
-    blueprints = [
-        horario_blueprint,
-        materia_blueprint,
-        professor_blueprint,
-        turma_blueprint
-    ]
-    
-    # Registra cada blueprint na instância do aplicativo Flask
-    for blueprint in blueprints:
-        app.register_blueprint(blueprint)
\ No newline at end of file
+    for blueprint in load_blueprints():
+        if blueprint.name not in app.blueprints:
+            app.register_blueprint(blueprint)
\ No newline at end of file
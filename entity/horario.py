@@ -1,27 +1,87 @@
 from config.globals import db
 from infrastructure.base_entity import BaseEntity
+from sqlalchemy.types import TypeDecorator
+
+# Valores permitidos para o dia da semana, na ordem da semana
+DIAS_DA_SEMANA = ('SEGUNDA', 'TERCA', 'QUARTA', 'QUINTA', 'SEXTA', 'SABADO', 'DOMINGO')
+
+class HoraMinutos(TypeDecorator):
+    """
+    Tipo de coluna que armazena uma hora no formato 'HH:MM' como minutos desde a meia-noite (0..1439).
+
+    A aplicação continua recebendo e devolvendo a hora como texto 'HH:MM'; apenas o armazenamento
+    passa a ser um inteiro pequeno. Valores gravados como texto por versões anteriores continuam
+    sendo lidos normalmente.
+    """
+    impl = db.SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """
+        Converte a hora 'HH:MM' em minutos antes de gravá-la.
+
+        Um inteiro é aceito como minutos desde a meia-noite, desde que esteja dentro de um dia.
+
+        Raises:
+            ValueError: Se a hora não estiver no formato 'HH:MM' ou estiver fora do intervalo de um dia.
+        """
+        if value is None:
+            return value
+        if isinstance(value, bool):
+            raise ValueError(f"Hora inválida: {value}")
+        if isinstance(value, int):
+            if not 0 <= value < 1440:
+                raise ValueError(f"Hora inválida: {value}")
+            return value
+        try:
+            horas, minutos = (int(parte) for parte in str(value).split(':'))
+        except ValueError:
+            raise ValueError(f"Hora inválida: {value}") from None
+        if not (0 <= horas < 24 and 0 <= minutos < 60):
+            raise ValueError(f"Hora inválida: {value}")
+        return horas * 60 + minutos
+
+    def process_result_value(self, value, dialect):
+        """
+        Converte os minutos armazenados de volta para o formato 'HH:MM'.
+
+        Em bancos criados com a coluna de texto, o SQLite devolve os minutos como texto ('545'),
+        e as horas gravadas antes da mudança ('08:00') são devolvidas como estão.
+        """
+        if value is None:
+            return value
+        if isinstance(value, str):
+            if ':' in value:
+                return value
+            value = int(value)
+        return f'{value // 60:02d}:{value % 60:02d}'
 
 class Horario(BaseEntity):
     """
     Representa a entidade Horario no banco de dados.
 
     Atributos:
-        dia_da_semana (str): Dia da semana do horário (valores permitidos: SEGUNDA a DOMINGO).
-        hora (str): Hora do horário (formato HH:MM).
+        dia_da_semana (str): Dia da semana do horário (valores permitidos: DIAS_DA_SEMANA, de SEGUNDA a DOMINGO).
+        hora (str): Hora do horário (formato HH:MM), armazenada como minutos desde a meia-noite.
         turma_id (int): ID da relação com a entidade Turma.
         professor_id (int): ID da relação com a entidade Professor.
         materia_id (int): ID da relação com a entidade Materia.
         turma (Turma): Relação com a entidade Turma.
         professor (Professor): Relação com a entidade Professor.
         materia (Materia): Relação com a entidade Materia.
+        __search_columns__ (tuple): Colunas pesquisadas pelo filtro da listagem paginada.
+        __check_constraints__ (dict): Valores permitidos por coluna, validados antes do INSERT.
     """
     __tablename__ = 'horario'
+    __search_columns__ = ('dia_da_semana',)
+    __check_constraints__ = {'dia_da_semana': DIAS_DA_SEMANA}
 
-    dia_da_semana = db.Column(db.String(16), nullable=False)
-    hora = db.Column(db.String(5), nullable=False)
+    # No SQLite, que não tem tipo enum nativo, os valores continuam validados por uma restrição CHECK
+    dia_da_semana = db.Column(db.Enum(*DIAS_DA_SEMANA, name='dia_semana_enum', create_constraint=True), nullable=False)
+    hora = db.Column(HoraMinutos, nullable=False)
 
-    turma_id = db.Column(db.Integer, db.ForeignKey('turma.id', ondelete='CASCADE'), nullable=False)
-    professor_id = db.Column(db.Integer, db.ForeignKey('professor.id'), nullable=False)
+    turma_id = db.Column(db.Integer, db.ForeignKey('turma.id', ondelete='CASCADE'), nullable=False, index=True)
+    professor_id = db.Column(db.Integer, db.ForeignKey('professor.id'), nullable=False, index=True)
     materia_id = db.Column(db.Integer, db.ForeignKey('materia.id'), nullable=False)
 
     turma = db.relationship('Turma', back_populates='horarios')
@@ -29,7 +89,6 @@ class Horario(BaseEntity):
     materia = db.relationship('Materia', back_populates='horarios')
 
     __table_args__ = (
-        db.CheckConstraint(
-            dia_da_semana.in_(['SEGUNDA', 'TERCA', 'QUARTA', 'QUINTA', 'SEXTA', 'SABADO', 'DOMINGO']), name='chk_dia_semana'
-        ),
+        # Também atende as buscas apenas por materia_id, por ser a primeira coluna do índice
+        db.Index('ix_horario_materia_professor', 'materia_id', 'professor_id'),
     )
\ No newline at end of file
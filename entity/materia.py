@@ -1,6 +1,9 @@
+from collections import defaultdict
 from config.globals import db
+from entity.horario import Horario
 from entity.relations import professor_materia
 from infrastructure.base_entity import BaseEntity
+from sqlalchemy.orm import joinedload
 from typing import Dict, Optional, Set
 
 class Materia(BaseEntity):
@@ -11,8 +14,14 @@ class Materia(BaseEntity):
         nome (str): Nome da matéria, único e obrigatório.
         professores (List[Professor]): Relação muitos-para-muitos com a entidade Professor.
         horarios (List[Horario]): Relação um-para-muitos com a entidade Horario.
+        __search_columns__ (tuple): Colunas pesquisadas pelo filtro da listagem paginada.
+        __summary_columns__ (tuple): Colunas retornadas pelo resumo da listagem (`/all?fields=summary`).
+        __unique_keys__ (tuple): Colunas da restrição de unicidade usada no INSERT ... ON CONFLICT.
     """
     __tablename__ = 'materia'
+    __search_columns__ = ('nome',)
+    __summary_columns__ = ('id', 'nome')
+    __unique_keys__ = ('nome',)
 
     nome = db.Column(db.String(128), nullable=False, unique=True)
     professores = db.relationship('Professor', secondary=professor_materia, back_populates='materias')
@@ -22,6 +31,9 @@ class Materia(BaseEntity):
         """
         Converte o objeto Materia em um dicionário.
 
+        Os horários da matéria são buscados em uma única consulta (já com as turmas) e agrupados
+        por professor, em vez de percorrer todos os horários de cada professor.
+
         Args:
             visited (Optional[Set[int]]): Objetos já visitados para evitar loops de referência.
             max_depth (int): Profundidade máxima para serialização de relacionamentos.
@@ -30,6 +42,17 @@ class Materia(BaseEntity):
         Returns:
             Dict: Representação em dicionário do objeto Materia.
         """
+        turmas = {}  # Referências às turmas, compartilhadas entre os horários
+        horarios_por_professor = defaultdict(list)
+        horarios = (
+            db.session.query(Horario)
+            .options(joinedload(Horario.turma))
+            .filter(Horario.materia_id == self.id)
+            .order_by(Horario.id)
+        )
+        for horario in horarios:
+            horarios_por_professor[horario.professor_id].append(horario)
+
         return {
             'id': self.id,
             'nome': self.nome,
@@ -42,12 +65,9 @@ class Materia(BaseEntity):
                             'id': horario.id,
                             'dia_da_semana': horario.dia_da_semana,
                             'hora': horario.hora,
-                            'turma': {
-                                'id': horario.turma.id,
-                                'nome': horario.turma.nome
-                            }
+                            'turma': horario.turma.to_ref(turmas)
                         }
-                        for horario in professor.horarios if horario.materia_id == self.id
+                        for horario in horarios_por_professor[professor.id]
                     ]
                 }
                 for professor in self.professores
@@ -1,6 +1,10 @@
+from collections import defaultdict
 from config.globals import db
+from entity.horario import Horario
 from entity.relations import professor_materia
 from infrastructure.base_entity import BaseEntity
+from operator import attrgetter
+from sqlalchemy.orm import joinedload
 from typing import Dict, Optional, Set
 
 class Professor(BaseEntity):
@@ -11,8 +15,12 @@ class Professor(BaseEntity):
         nome (str): Nome do professor, obrigatório.
         materias (List[Materia]): Relação muitos-para-muitos com a entidade Materia.
         horarios (List[Horario]): Relação um-para-muitos com a entidade Horario.
+        __search_columns__ (tuple): Colunas pesquisadas pelo filtro da listagem paginada.
+        __summary_columns__ (tuple): Colunas retornadas pelo resumo da listagem (`/all?fields=summary`).
     """
     __tablename__ = 'professor'
+    __search_columns__ = ('nome',)
+    __summary_columns__ = ('id', 'nome')
 
     nome = db.Column(db.String(128), nullable=False)
     materias = db.relationship('Materia', secondary=professor_materia, back_populates='professores')
@@ -22,6 +30,11 @@ class Professor(BaseEntity):
         """
         Converte o objeto Professor em um dicionário.
 
+        Os horários do professor são buscados em uma única consulta (já com as turmas) e agrupados
+        por matéria, em vez de percorrer todos os horários para cada matéria. Se a coleção de
+        horários já tiver sido carregada (nas listagens, para todos os professores de uma vez),
+        ela é usada sem nova consulta.
+
         Args:
             visited (Optional[Set[int]]): Objetos já visitados para evitar loops de referência.
             max_depth (int): Profundidade máxima para serialização de relacionamentos.
@@ -30,6 +43,20 @@ class Professor(BaseEntity):
         Returns:
             Dict: Representação em dicionário do objeto Professor.
         """
+        turmas = {}  # Referências às turmas, compartilhadas entre os horários
+        horarios_por_materia = defaultdict(list)
+        if 'horarios' in self.__dict__:
+            horarios = sorted(self.horarios, key=attrgetter('id'))
+        else:
+            horarios = (
+                db.session.query(Horario)
+                .options(joinedload(Horario.turma))
+                .filter(Horario.professor_id == self.id)
+                .order_by(Horario.id)
+            )
+        for horario in horarios:
+            horarios_por_materia[horario.materia_id].append(horario)
+
         return {
             'id': self.id,
             'nome': self.nome,
@@ -42,12 +69,9 @@ class Professor(BaseEntity):
                             'id': horario.id,
                             'dia_da_semana': horario.dia_da_semana,
                             'hora': horario.hora,
-                            'turma': {
-                                'id': horario.turma.id,
-                                'nome': horario.turma.nome
-                            }
+                            'turma': horario.turma.to_ref(turmas)
                         }
-                        for horario in self.horarios if horario.materia_id == materia.id
+                        for horario in horarios_por_materia[materia.id]
                     ]
                 }
                 for materia in self.materias
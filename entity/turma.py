@@ -1,5 +1,8 @@
 from config.globals import db
+from entity.horario import Horario
 from infrastructure.base_entity import BaseEntity
+from operator import attrgetter
+from sqlalchemy.orm import joinedload
 from typing import Dict, Optional, Set
 
 class Turma(BaseEntity):
@@ -8,6 +11,9 @@ class Turma(BaseEntity):
     
     Atributos:
         __tablename__ (str): Nome da tabela no banco de dados.
+        __search_columns__ (tuple): Colunas pesquisadas pelo filtro da listagem paginada.
+        __summary_columns__ (tuple): Colunas retornadas pelo resumo da listagem (`/all?fields=summary`).
+        __unique_keys__ (tuple): Colunas da restrição de unicidade usada no INSERT ... ON CONFLICT.
         nome (db.Column): Nome da turma, que é único e obrigatório.
         horarios (db.relationship): Relacionamento com a tabela "Horario", com uma 
                                     associação bi-direcional e uma política de 
@@ -20,6 +26,9 @@ class Turma(BaseEntity):
     """
     
     __tablename__ = 'turma'
+    __search_columns__ = ('nome',)
+    __summary_columns__ = ('id', 'nome')
+    __unique_keys__ = ('nome',)
     
     nome = db.Column(db.String(128), nullable=False, unique=True)
     horarios = db.relationship("Horario", back_populates="turma", cascade="all, delete-orphan")
@@ -29,6 +38,11 @@ class Turma(BaseEntity):
         Converte a instância da turma em um dicionário, incluindo seus relacionamentos
         com horários, matérias e professores.
 
+        Os horários são buscados em uma única consulta que já carrega a matéria e o
+        professor de cada um, evitando uma consulta extra por horário. Se a coleção de
+        horários já tiver sido carregada (nas listagens, para todas as turmas de uma vez),
+        ela é usada sem nova consulta.
+
         Args:
             visited (Optional[Set[int]]): Conjunto opcional para evitar ciclos em 
                                           relacionamentos de entidades.
@@ -40,6 +54,18 @@ class Turma(BaseEntity):
             Dict: Representação em dicionário da turma, incluindo seus horários, 
                   matérias e professores.
         """
+        if 'horarios' in self.__dict__:
+            horarios = sorted(self.horarios, key=attrgetter('id'))
+        else:
+            horarios = (
+                db.session.query(Horario)
+                .options(joinedload(Horario.materia), joinedload(Horario.professor))
+                .filter(Horario.turma_id == self.id)
+                .order_by(Horario.id)
+            )
+        # Referências às matérias e aos professores, compartilhadas entre os horários
+        materias, professores = {}, {}
+
         return {
             "id": self.id,
             "nome": self.nome,
@@ -48,15 +74,9 @@ class Turma(BaseEntity):
                     "id": horario.id,
                     "dia_da_semana": horario.dia_da_semana,
                     "hora": horario.hora,
-                    "materia": {
-                        "id": horario.materia.id,
-                        "nome": horario.materia.nome
-                    },
-                    "professor": {
-                        "id": horario.professor.id,
-                        "nome": horario.professor.nome
-                    },
+                    "materia": horario.materia.to_ref(materias),
+                    "professor": horario.professor.to_ref(professores),
                 }
-                for horario in self.horarios
+                for horario in horarios
             ]
         }
\ No newline at end of file
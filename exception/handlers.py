@@ -5,7 +5,10 @@ from exception.error_invalid_object import ErrorInvalidObject
 from exception.error_not_found import ErrorNotFound
 from exception.error_object_already_exists import ErrorObjectAlreadyExist
 from exception.error_update import ErrorUpdate
-from flask import jsonify
+from functools import partial
+from infrastructure.base_error import BaseError
+from infrastructure.json_response import make_json_response
+from werkzeug.exceptions import HTTPException
 
 class ErrorHandlerRegistry:
     """
@@ -14,8 +17,24 @@ class ErrorHandlerRegistry:
     Esta classe registra handlers de erro para exceções específicas, como `ErrorExecution`, `ErrorNotFound`, `ErrorCreation`,
     entre outras. Para cada erro tratado, uma resposta JSON padronizada é retornada ao cliente, com a mensagem de erro apropriada
     e o código de status HTTP correspondente.
+
+    Atributos:
+        GENERIC_ERROR_MESSAGE (str): Mensagem retornada para exceções não tratadas.
+        HANDLERS (tuple): Pares `(classe da exceção, status HTTP)` tratados pelo registrador.
     """
 
+    GENERIC_ERROR_MESSAGE = 'Erro desconhecido interno do servidor, por favor entre em contato com o suporte.'
+    HANDLERS = (
+        (Exception, 500),
+        (ErrorExecution, 500),
+        (ErrorNotFound, 404),
+        (ErrorCreation, 400),
+        (ErrorObjectAlreadyExist, 400),
+        (ErrorInvalidObject, 400),
+        (ErrorUpdate, 400),
+        (ErrorDelete, 400)
+    )
+
     def __init__(self, app):
         """
         Inicializa o registrador de handlers de erro.
@@ -28,102 +47,27 @@ class ErrorHandlerRegistry:
 
     def register_error_handlers(self):
         """
-        Registra os handlers de erro na aplicação Flask.
+        Registra os handlers de erro na aplicação Flask, um para cada exceção de `HANDLERS`.
         """
-        self.app.errorhandler(Exception)(self.handle_generic_error)
-        self.app.errorhandler(ErrorExecution)(self.handle_execution_error)
-        self.app.errorhandler(ErrorNotFound)(self.handle_not_found_error)
-        self.app.errorhandler(ErrorCreation)(self.handle_creation_error)
-        self.app.errorhandler(ErrorObjectAlreadyExist)(self.handle_object_already_exist_error)
-        self.app.errorhandler(ErrorInvalidObject)(self.handle_invalid_object)
-        self.app.errorhandler(ErrorUpdate)(self.handle_update_error)
-        self.app.errorhandler(ErrorDelete)(self.handle_deletion_error)
+        for error_class, status_code in self.HANDLERS:
+            self.app.errorhandler(error_class)(partial(self._handle, status_code=status_code))
 
-    @staticmethod
-    def create_error_response(error, default_message, status_code):
+    def _handle(self, error: Exception, status_code: int):
         """
-        Cria uma resposta de erro JSON padronizada e registra o erro nos logs.
+        Cria uma resposta de erro JSON padronizada.
+
+        Exceções da aplicação (BaseError) retornam a sua mensagem; as demais exceções retornam a
+        mensagem genérica, sem expor detalhes internos. Exceções HTTP do Flask (como rota inexistente
+        ou método não permitido) mantêm a resposta e o status originais.
 
         Args:
             error (Exception): A exceção que foi capturada.
-            default_message (str): A mensagem padrão a ser retornada no caso de erro.
             status_code (int): O código de status HTTP a ser retornado.
 
         Retorna:
-            Tuple[Response, int]: Uma resposta JSON contendo a mensagem de erro e o status code.
-        """
-        response = jsonify({'message': error.message})
-        response.status_code = status_code
-        return response
-
-    def handle_generic_error(self, error: Exception):
-        """
-        Manipula exceções genéricas não tratadas.
-
-        Retorna:
-            500 Internal Server Error com uma mensagem de erro padrão.
-        """
-        return self.create_error_response(error, 'Erro desconhecido interno do servidor, por favor entre em contato com o suporte.', 500)
-
-    def handle_execution_error(self, error: ErrorExecution):
-        """
-        Manipula erros internos de execução.
-
-        Retorna:
-            500 Internal Server Error com uma mensagem padrão de erro de execução.
-        """
-        return self.create_error_response(error, ErrorExecution.DEFAULT_MESSAGE, 500)
-
-    def handle_not_found_error(self, error: ErrorNotFound):
-        """
-        Manipula erros de recursos não encontrados.
-
-        Retorna:
-            404 Not Found com uma mensagem padrão de "não encontrado".
-        """
-        return self.create_error_response(error, ErrorNotFound.DEFAULT_MESSAGE, 404)
-
-    def handle_creation_error(self, error: ErrorCreation):
-        """
-        Manipula erros ao criar objetos.
-
-        Retorna:
-            400 Bad Request com uma mensagem padrão de erro de criação.
-        """
-        return self.create_error_response(error, ErrorCreation.DEFAULT_MESSAGE, 400)
-
-    def handle_object_already_exist_error(self, error: ErrorObjectAlreadyExist):
-        """
-        Manipula erros onde o objeto já existe no sistema.
-
-        Retorna:
-            400 Bad Request com uma mensagem padrão de "objeto já existe".
-        """
-        return self.create_error_response(error, ErrorObjectAlreadyExist.DEFAULT_MESSAGE, 400)
-
-    def handle_invalid_object(self, error: ErrorInvalidObject):
-        """
-        Manipula erros de objetos inválidos.
-
-        Retorna:
-            400 Bad Request com uma mensagem padrão de "objeto inválido".
-        """
-        return self.create_error_response(error, ErrorInvalidObject.DEFAULT_MESSAGE, 400)
-
-    def handle_update_error(self, error: ErrorUpdate):
-        """
-        Manipula erros ao atualizar objetos.
-
-        Retorna:
-            400 Bad Request com uma mensagem padrão de erro de atualização.
-        """
-        return self.create_error_response(error, ErrorUpdate.DEFAULT_MESSAGE, 400)
-
-    def handle_deletion_error(self, error: ErrorDelete):
-        """
-        Manipula erros ao deletar objetos.
-
-        Retorna:
-            400 Bad Request com uma mensagem padrão de erro de deleção.
+            Response: Uma resposta JSON contendo a mensagem de erro e o status code.
         """
-        return self.create_error_response(error, ErrorDelete.DEFAULT_MESSAGE, 400)
\ No newline at end of file
+        if isinstance(error, HTTPException):
+            return error
+        message = error.message if isinstance(error, BaseError) else self.GENERIC_ERROR_MESSAGE
+        return make_json_response({'message': message}, status_code)
\ No newline at end of file
@@ -1,11 +1,18 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, stream_with_context
+from exception.error_invalid_object import ErrorInvalidObject
 from infrastructure.base_model import BaseModel
 from infrastructure.base_service import BaseService
-from typing import Type, Dict, Any, Tuple, Generic, TypeVar
+from infrastructure.json_response import JSON_MIMETYPE, STREAM_CHUNK_SIZE, dumps_json, make_json_response, make_stream_response, wants_msgpack
+from itertools import chain
+from typing import Type, Generic, TypeVar
 import logging
+import orjson
 
 T = TypeVar('T', bound=BaseModel)
 
+# Corpo da resposta de exclusão, serializado uma única vez
+_DELETED_BODY = orjson.dumps({'mensagem': 'Deletado com sucesso'})
+
 class BaseController(Generic[T]):
     """
     Classe base para controladores que implementam operações CRUD (Create, Read, Update, Delete).
@@ -36,6 +43,12 @@ class BaseController(Generic[T]):
         create():
             Cria um novo item com base nos dados fornecidos no corpo da requisição.
 
+        create_many():
+            Cria vários itens em lote a partir da lista enviada no corpo da requisição.
+
+        update_many():
+            Atualiza vários itens em lote a partir da lista enviada no corpo da requisição.
+
         update(id: int):
             Atualiza um item existente com base no ID e nos dados fornecidos.
 
@@ -43,21 +56,29 @@ class BaseController(Generic[T]):
             Deleta um item com base no ID fornecido.
     """
     
-    _logger: logging.Logger
+    MAX_PAGE_SIZE = 500  # Limite de itens por página, mesmo que o cliente peça mais
+    _logger: logging.Logger = logging.getLogger('BaseController')
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Cria o logger de cada subclasse uma única vez, com o nome da classe do controlador.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
 
     def __init__(self, service_class: Type[BaseService[T]], blueprint_name: str, prefix: str = '/api'):
         """
         Inicializa o controlador base com um serviço e um blueprint.
 
         Args:
-            service_class (Type[BaseService[T]]): Classe de serviço responsável por manipular o modelo de dados T.
+            service_class (Type[BaseService[T]]): Classe de serviço responsável por manipular o modelo de dados T;
+                                                  é usada a instância única do serviço (`instance()`).
             blueprint_name (str): Nome do blueprint Flask.
             prefix (str): Prefixo da URL para o conjunto de rotas. O padrão é '/api'.
         """
         self.blueprint: Blueprint = Blueprint(blueprint_name, __name__, url_prefix=f'{prefix}/{blueprint_name}')
-        self.service: BaseService[T] = service_class()
+        self.service: BaseService[T] = service_class.instance()
         self.register_routes()
-        self._logger = logging.getLogger(self.__class__.__name__)
 
     def register_routes(self) -> None:
         """
@@ -65,10 +86,12 @@ class BaseController(Generic[T]):
 
         As seguintes rotas são registradas:
         - GET /<int:id>: Busca um item pelo ID.
-        - GET /: Retorna uma lista paginada de itens.
-        - GET /all: Retorna todos os itens sem paginação.
-        - GET /count: Conta o número total de registros.
+        - GET /: Retorna uma lista paginada de itens, com o total de itens do filtro.
+        - GET /all: Retorna todos os itens sem paginação (ou apenas o resumo, com `fields=summary`).
+        - GET /count: Conta o número total de registros (legado; o total já vem na listagem paginada).
         - POST /: Cria um novo item.
+        - POST /bulk: Cria vários itens em lote.
+        - PUT /bulk: Atualiza vários itens em lote.
         - PUT /<int:id>: Atualiza um item existente.
         - DELETE /<int:id>: Deleta um item existente.
         """
@@ -78,13 +101,16 @@ class BaseController(Generic[T]):
             ('/all', 'get_all_without_pagination', self.get_all_without_pagination, ['GET']),
             ('/count', 'count_all', self.count_all, ['GET']),
             ('/', 'create', self.create, ['POST']),
+            ('/bulk', 'create_many', self.create_many, ['POST']),
+            ('/bulk', 'update_many', self.update_many, ['PUT']),
             ('/<int:id>', 'update', self.update, ['PUT']),
             ('/<int:id>', 'delete', self.delete, ['DELETE'])
         ]
         for route, endpoint, view_func, methods in routes:
-            self.blueprint.add_url_rule(route, endpoint, view_func, methods=methods)
+            # Sem strict_slashes, '/api/<nome>' e '/api/<nome>/' atendem à mesma rota, sem redirecionamento
+            self.blueprint.add_url_rule(route, endpoint, view_func, methods=methods, strict_slashes=False)
 
-    def get_by_id(self, id: int) -> Tuple[Dict[str, Any], int]:
+    def get_by_id(self, id: int) -> Response:
         """
         Busca um item pelo ID.
 
@@ -92,51 +118,127 @@ class BaseController(Generic[T]):
             id (int): O ID do item a ser buscado.
 
         Retorna:
-            Tuple[Dict[str, Any], int]: O item no formato JSON e o status HTTP 200.
+            Response: O item no formato JSON, com o status HTTP 200.
         """
-        self._logger.info(f'Obtendo item com ID {id}')
+        self._logger.info('Obtendo item com ID %s', id)
         result = self.service.get_by_id(id)
-        return jsonify(result.to_dict()), 200
+        return make_json_response(result.to_dict(), 200)
 
-    def get_all(self) -> Tuple[Dict[str, Any], int]:
+    def get_all(self) -> Response:
         """
         Busca uma lista paginada de itens, com base nos parâmetros de paginação e filtro.
 
+        A página retornada inclui `total_items`, contado a partir da mesma consulta filtrada, de modo
+        que o cliente não precisa chamar `/count` para montar a paginação.
+
+        Com o parâmetro `cursor` (o `next_cursor` da página anterior; `0` para a primeira página), a
+        paginação é feita por cursor: o custo não depende da profundidade e `total_items` não é contado.
+
+        O tamanho da página é limitado a `MAX_PAGE_SIZE`, e valores menores que 1 são tratados como 1.
+
         Retorna:
-            Tuple[Dict[str, Any], int]: Lista paginada de itens no formato JSON e o status HTTP 200.
-        """
-        page_number = int(request.args.get('page_number', 1))
-        page_size = int(request.args.get('page_size', 10))
-        filter_str = request.args.get('filter', '')
-        
-        self._logger.info(f'Obtendo itens - Página {page_number}, Tamanho {page_size}, Filtro "{filter_str}"')
-        results = self.service.get_all(page_number, page_size, filter_str)
-        return jsonify(results.to_dict()), 200
+            Response: Lista paginada de itens no formato JSON, com o status HTTP 200.
 
-    def get_all_without_pagination(self) -> Tuple[Dict[str, Any], int]:
+        Raises:
+            ErrorInvalidObject: Se o `cursor` não for um inteiro não negativo.
+        """
+        args = request.args
+        page_number = max(int(args.get('page_number') or 1), 1)
+        page_size = min(max(int(args.get('page_size') or 10), 1), self.MAX_PAGE_SIZE)
+        filter_str = args.get('filter') or ''
+        cursor = args.get('cursor') or None
+        if cursor is not None:
+            if not cursor.isdecimal():
+                raise ErrorInvalidObject(f'Cursor inválido: {cursor}')
+            cursor = int(cursor)
+
+        self._logger.info('Obtendo itens - Página %s, Tamanho %s, Filtro "%s", Cursor %s', page_number, page_size, filter_str, cursor)
+        results = self.service.get_all(page_number, page_size, filter_str, cursor)
+        # A página (dataclass) é serializada diretamente pelo encoder; só os itens passam pelo to_dict
+        return make_json_response(results, 200)
+
+    def get_all_without_pagination(self) -> Response:
         """
         Busca todos os itens sem paginação.
 
+        Com `fields=summary`, retorna apenas o resumo de cada item (por exemplo, `[id, nome]`), lido como
+        tuplas, sem carregar as entidades nem os relacionamentos.
+
         Retorna:
-            Tuple[Dict[str, Any], int]: Lista de todos os itens no formato JSON e o status HTTP 200.
+            Response: Lista de todos os itens no formato JSON, enviada em streaming, com o status HTTP 200.
         """
+        if request.args.get('fields') == 'summary':
+            self._logger.info('Obtendo o resumo de todos os itens')
+            return make_json_response(self.service.list_summary(), 200)
+
         self._logger.info('Obtendo todos os itens sem paginação')
         results = self.service.get_all_without_pagination()
-        return jsonify([item.to_dict() for item in results]), 200
-
-    def create(self) -> Tuple[Dict[str, Any], int]:
+        if wants_msgpack():
+            return make_json_response([item.to_dict() for item in results], 200)
+
+        def generate():
+            # Cada item é serializado assim que chega do banco, sem montar a lista inteira de dicionários,
+            # e enviado em pedaços de pelo menos STREAM_CHUNK_SIZE bytes
+            buf = bytearray(b'[')
+            for index, item in enumerate(results):
+                if index:
+                    buf += b','
+                buf += dumps_json(item.to_dict())
+                if len(buf) >= STREAM_CHUNK_SIZE:
+                    yield bytes(buf)
+                    buf.clear()
+            buf += b']'
+            yield bytes(buf)
+
+        # O primeiro pedaço é gerado antes de a resposta começar: um erro na consulta ainda vira uma
+        # resposta de erro comum, e não um corpo interrompido no meio
+        chunks = stream_with_context(generate())
+        first_chunk = next(chunks)
+        return make_stream_response(chain((first_chunk,), chunks), 200, JSON_MIMETYPE)
+
+    def create(self) -> Response:
         """
         Cria um novo item com base nos dados fornecidos.
 
         Retorna:
-            Tuple[Dict[str, Any], int]: O item criado no formato JSON e o status HTTP 201.
+            Response: O item criado no formato JSON, com o status HTTP 201.
         """
-        data = request.json
-        self._logger.info(f'Criando novo item com dados: {data}')
+        data = request.get_json(cache=False)
+        self._logger.info('Criando novo item')
+        # O corpo da requisição só é formatado quando o nível DEBUG está habilitado
+        self._logger.debug('Dados do novo item: %s', data)
         result = self.service.create(data)
-        return jsonify(result.to_dict()), 201
+        return make_json_response(result.to_dict(), 201)
+
+    def create_many(self) -> Response:
+        """
+        Cria vários itens em lote, com um INSERT em massa e um único commit.
 
-    def update(self, id: int) -> Tuple[Dict[str, Any], int]:
+        Retorna:
+            Response: Os itens criados no formato JSON, na ordem recebida, com o status HTTP 201.
+        """
+        data = request.get_json(cache=False)
+        if not isinstance(data, list):
+            raise ErrorInvalidObject('O corpo da requisição deve ser uma lista de itens.')
+        self._logger.info('Criando %s itens em lote', len(data))
+        results = self.service.create_many(data)
+        return make_json_response([item.to_dict() for item in results], 201)
+
+    def update_many(self) -> Response:
+        """
+        Atualiza vários itens em lote, com um UPDATE em massa pela chave primária e um único commit.
+
+        Retorna:
+            Response: Os itens atualizados no formato JSON, na ordem recebida, com o status HTTP 200.
+        """
+        data = request.get_json(cache=False)
+        if not isinstance(data, list):
+            raise ErrorInvalidObject('O corpo da requisição deve ser uma lista de itens.')
+        self._logger.info('Atualizando %s itens em lote', len(data))
+        results = self.service.update_many(data)
+        return make_json_response([item.to_dict() for item in results], 200)
+
+    def update(self, id: int) -> Response:
         """
         Atualiza um item existente com base no ID e nos dados fornecidos.
 
@@ -144,14 +246,15 @@ class BaseController(Generic[T]):
             id (int): O ID do item a ser atualizado.
 
         Retorna:
-            Tuple[Dict[str, Any], int]: O item atualizado no formato JSON e o status HTTP 200.
+            Response: O item atualizado no formato JSON, com o status HTTP 200.
         """
-        data = request.json
-        self._logger.info(f'Atualizando item com ID {id} com dados: {data}')
+        data = request.get_json(cache=False)
+        self._logger.info('Atualizando item com ID %s', id)
+        self._logger.debug('Dados da atualização do item com ID %s: %s', id, data)
         result = self.service.update(id, data)
-        return jsonify(result.to_dict()), 200
+        return make_json_response(result.to_dict(), 200)
 
-    def delete(self, id: int) -> Tuple[Dict[str, Any], int]:
+    def delete(self, id: int) -> Response:
         """
         Deleta um item existente com base no ID fornecido.
 
@@ -159,19 +262,22 @@ class BaseController(Generic[T]):
             id (int): O ID do item a ser deletado.
 
         Retorna:
-            Tuple[Dict[str, Any], int]: Mensagem de sucesso e o status HTTP 204.
+            Response: Mensagem de sucesso no formato JSON, com o status HTTP 204.
         """
-        self._logger.info(f'Deletando item com ID {id}')
+        self._logger.info('Deletando item com ID %s', id)
         self.service.delete(id)
-        return jsonify({'mensagem': 'Deletado com sucesso'}), 204
+        return Response(_DELETED_BODY, status=204, mimetype=JSON_MIMETYPE)
     
-    def count_all(self) -> Tuple[Dict[str, Any], int]:
+    def count_all(self) -> Response:
         """
         Conta o número total de registros.
 
+        Rota legada, mantida para compatibilidade: a listagem paginada (`GET /`) já retorna o total em
+        `total_items`, na mesma requisição e considerando o filtro aplicado.
+
         Retorna:
-            Tuple[Dict[str, Any], int]: O número total de registros no formato JSON e o status HTTP 200.
+            Response: O número total de registros no formato JSON, com o status HTTP 200.
         """
         self._logger.info('Contando o total de registros')
         total_count = self.service.count_all()
-        return jsonify({'total_count': total_count}), 200
\ No newline at end of file
+        return make_json_response({'total_count': total_count}, 200)
\ No newline at end of file
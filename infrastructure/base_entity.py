@@ -1,5 +1,6 @@
 from config.globals import db
 from infrastructure.base_model import BaseModel
+from typing import Any, Dict, Optional
 
 class BaseEntity(db.Model, BaseModel):
     """
@@ -11,7 +12,34 @@ class BaseEntity(db.Model, BaseModel):
 
     Atributos:
         id (int): Chave primária da entidade, gerada automaticamente com auto-incremento.
+
+    Métodos:
+        to_ref(refs):
+            Retorna a referência resumida (id e nome) da entidade, usada ao aninhá-la em outra serialização.
     """
     __abstract__ = True
 
-    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
\ No newline at end of file
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    def to_ref(self, refs: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Retorna a referência resumida da entidade, com o `id` e o `nome`.
+
+        Destina-se às entidades que possuem o atributo `nome` e são aninhadas em outras
+        serializações (por exemplo, a turma de cada horário).
+
+        Args:
+            refs (Optional[Dict[int, Dict[str, Any]]]): Referências já montadas na serialização atual,
+                indexadas pelo ID. Quando informado, uma entidade referenciada várias vezes gera um
+                único dicionário, reaproveitado em todas as ocorrências. O cache deve durar apenas
+                uma serialização, para não devolver nomes desatualizados.
+
+        Returns:
+            Dict[str, Any]: Dicionário com o `id` e o `nome` da entidade.
+        """
+        if refs is None:
+            return {'id': self.id, 'nome': self.nome}
+        ref = refs.get(self.id)
+        if ref is None:
+            ref = refs[self.id] = {'id': self.id, 'nome': self.nome}
+        return ref
\ No newline at end of file
@@ -25,4 +25,4 @@ class BaseError(Exception):
                                      será usada a mensagem padrão definida no atributo `DEFAULT_MESSAGE`.
         """
         self.message = message or self.DEFAULT_MESSAGE
-        super().__init__(self.message)
\ No newline at end of file
+        Exception.__init__(self, self.message)  # Chamada direta, sem a resolução do MRO pelo super()
\ No newline at end of file
@@ -1,7 +1,30 @@
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Set, Optional
+from typing import Callable, Dict, Any, Set, Optional, Tuple
+import itertools
 import logging
 
+# Chave gravada no __dict__ dos objetos já visitados pelo to_dict, com o token da serialização atual
+_STAMP_KEY = '_to_dict_token'
+_stamp_counter = itertools.count(1)
+
+def _fetch_or_create(related_class: type, item: Dict[str, Any], session: Session) -> 'BaseModel':
+    """
+    Busca o objeto relacionado pelo `id` informado nos dados ou cria um novo, e o popula com os dados.
+
+    Args:
+        related_class (type): Classe do objeto relacionado.
+        item (Dict[str, Any]): Dados do objeto relacionado.
+        session (Session): Sessão do SQLAlchemy para a busca do objeto.
+
+    Returns:
+        BaseModel: O objeto existente ou recém-criado, atualizado com os dados.
+    """
+    if 'id' in item:
+        existing = session.query(related_class).get(item['id'])
+        if existing:
+            return existing.from_dict(item, session)
+    return related_class().from_dict(item, session)
+
 class BaseModel:
     """
     Classe base abstrata para todas as entidades do modelo. Esta classe fornece métodos utilitários para 
@@ -10,11 +33,32 @@ class BaseModel:
     Atributos:
         __abstract__ (bool): Indicador de que esta é uma classe abstrata do SQLAlchemy.
         _logger (logging.Logger): Logger para registrar eventos e erros durante as operações de conversão e relacionamento.
+        _col_keys_cache (Dict[type, Tuple[str, ...]]): Nomes das colunas de cada classe mapeada, calculados no primeiro uso.
+        _rel_keys_cache (Dict[type, Tuple[str, ...]]): Nomes dos relacionamentos de cada classe mapeada, calculados no primeiro uso.
+        _column_dict_cache (Dict[type, Callable]): Funções geradas para cada classe mapeada que montam o dicionário das colunas.
+        _rel_meta_cache (Dict[type, Dict[str, Tuple[type, bool]]]): Classe relacionada e indicador de lista de cada
+            relacionamento das classes mapeadas, calculados no primeiro uso.
     """
     __abstract__ = True
     _logger: logging.Logger = logging.getLogger(__name__)
+    _col_keys_cache: Dict[type, Tuple[str, ...]] = {}
+    _rel_keys_cache: Dict[type, Tuple[str, ...]] = {}
+    _column_dict_cache: Dict[type, Callable[['BaseModel'], Dict[str, Any]]] = {}
+    _rel_meta_cache: Dict[type, Dict[str, Tuple[type, bool]]] = {}
 
     def __repr__(self) -> str:
+        """
+        Retorna uma representação curta do objeto, apenas com a classe e o ID.
+
+        Não acessa os demais atributos, evitando carregar colunas e relacionamentos quando o objeto
+        aparece em logs e mensagens de erro. Para listar todos os atributos, use `full_repr`.
+
+        Returns:
+            str: Uma string no formato `<Classe id=...>`.
+        """
+        return f'<{type(self).__name__} id={self.__dict__.get("id")}>'
+
+    def full_repr(self) -> str:
         """
         Retorna uma representação string do objeto, listando os atributos definidos.
 
@@ -28,6 +72,85 @@ class BaseModel:
         except Exception as e:
             return f'<{self.__class__.__name__}(error={e})>'
 
+    @classmethod
+    def _col_keys(cls) -> Tuple[str, ...]:
+        """
+        Retorna os nomes das colunas mapeadas da classe, guardados após a primeira consulta ao mapper.
+
+        Returns:
+            Tuple[str, ...]: Os nomes das colunas.
+        """
+        keys = cls._col_keys_cache.get(cls)
+        if keys is None:
+            keys = cls._col_keys_cache[cls] = tuple(cls.__mapper__.columns.keys())
+        return keys
+
+    @classmethod
+    def _rel_keys(cls) -> Tuple[str, ...]:
+        """
+        Retorna os nomes dos relacionamentos mapeados da classe, guardados após a primeira consulta ao mapper.
+
+        Returns:
+            Tuple[str, ...]: Os nomes dos relacionamentos.
+        """
+        keys = cls._rel_keys_cache.get(cls)
+        if keys is None:
+            keys = cls._rel_keys_cache[cls] = tuple(cls.__mapper__.relationships.keys())
+        return keys
+
+    @classmethod
+    def _rel_meta(cls) -> Dict[str, Tuple[type, bool]]:
+        """
+        Retorna, para cada relacionamento da classe, a classe relacionada e se o relacionamento é uma lista.
+
+        Returns:
+            Dict[str, Tuple[type, bool]]: Mapeamento do nome do relacionamento para `(classe relacionada, uselist)`.
+        """
+        meta = cls._rel_meta_cache.get(cls)
+        if meta is None:
+            meta = cls._rel_meta_cache[cls] = {
+                key: (rel.mapper.class_, rel.uselist) for key, rel in cls.__mapper__.relationships.items()
+            }
+        return meta
+
+    @classmethod
+    def _column_dict_function(cls) -> Callable[['BaseModel'], Dict[str, Any]]:
+        """
+        Retorna a função que monta o dicionário das colunas de uma instância da classe.
+
+        Na primeira chamada, o código da função é gerado e compilado para o esquema da classe, com
+        um acesso direto a cada atributo (`{'id': self.id, 'nome': self.nome, ...}`), evitando percorrer
+        os nomes das colunas e chamar `getattr` para cada objeto serializado.
+
+        Os valores são lidos primeiro do `__dict__` da instância, onde o SQLAlchemy guarda as colunas já
+        carregadas, sem passar pelo descritor instrumentado de cada atributo. Se alguma coluna não estiver
+        carregada (expirada ou adiada), a função lê os atributos normalmente, o que dispara o carregamento.
+
+        Returns:
+            Callable[[BaseModel], Dict[str, Any]]: A função que recebe a instância e retorna as suas colunas.
+        """
+        function = cls._column_dict_cache.get(cls)
+        if function is None:
+            keys = cls._col_keys()
+            if all(key.isidentifier() for key in keys):
+                loaded = ', '.join(f'{key!r}: values[{key!r}]' for key in keys)
+                items = ', '.join(f'{key!r}: self.{key}' for key in keys)
+                source = (
+                    'def _column_dict(self):\n'
+                    '    values = self.__dict__\n'
+                    '    try:\n'
+                    f'        return {{{loaded}}}\n'
+                    '    except KeyError:\n'
+                    f'        return {{{items}}}\n'
+                )
+                namespace = {}
+                exec(compile(source, f'<{cls.__name__}._column_dict>', 'exec'), namespace)
+                function = namespace['_column_dict']
+            else:
+                function = lambda self: {key: getattr(self, key) for key in keys}
+            cls._column_dict_cache[cls] = function
+        return function
+
     def from_dict(self, data: Dict[str, Any], session: Session) -> 'BaseModel':
         """
         Popula o objeto com os valores de um dicionário, incluindo atributos simples e relacionamentos.
@@ -43,10 +166,11 @@ class BaseModel:
             Exception: Se ocorrer um erro ao carregar os dados.
         """
         try:
+            col_keys, rel_keys = self._col_keys(), self._rel_keys()
             for key, value in data.items():
-                if key in self.__mapper__.columns.keys():
+                if key in col_keys:
                     setattr(self, key, value)
-                elif key in self.__mapper__.relationships.keys():
+                elif key in rel_keys:
                     self._handle_relationship(key, value, session)
                 else:
                     self._logger.warning(f'Atributo {key} não encontrado na classe {self.__class__.__name__}')
@@ -58,26 +182,24 @@ class BaseModel:
     def _handle_relationship(self, key: str, value: Any, session: Session):
         """
         Trata os relacionamentos definidos no modelo, populando os atributos relacionados de acordo
-        com os dados fornecidos.
+        com os dados fornecidos. Em relacionamentos do tipo lista, os objetos já existentes são
+        carregados de uma vez; os itens sem `id`, ou com um `id` inexistente, geram novos objetos.
 
         Args:
             key (str): Nome do atributo de relacionamento.
             value (Any): Dados relacionados (pode ser um objeto ou uma lista de objetos).
             session (Session): Sessão do SQLAlchemy para buscar ou criar objetos relacionados.
         """
-        rel = self.__mapper__.relationships[key]
-        related_class = rel.mapper.class_
-
-        def fetch_or_create(item):
-            if 'id' in item:
-                existing = session.query(related_class).get(item['id'])
-                return existing.from_dict(item, session) if existing else related_class().from_dict(item, session)
-            return related_class().from_dict(item, session)
-
-        if rel.uselist:
-            setattr(self, key, [fetch_or_create(item) for item in value])
+        related_class, uselist = self._rel_meta()[key]
+        if uselist:
+            # Os objetos existentes da lista são buscados em uma única consulta (IN), em vez de um por item
+            ids = [item['id'] for item in value if item.get('id') is not None]
+            existing = {}
+            if ids:
+                existing = {obj.id: obj for obj in session.query(related_class).filter(related_class.id.in_(ids))}
+            setattr(self, key, [(existing.get(item.get('id')) or related_class()).from_dict(item, session) for item in value])
         else:
-            setattr(self, key, fetch_or_create(value))
+            setattr(self, key, _fetch_or_create(related_class, value, session))
 
     def to_dict(self, visited: Optional[Set[int]] = None, max_depth: int = 5, current_depth: int = 0) -> Optional[Dict[str, Any]]:
         """
@@ -94,99 +216,137 @@ class BaseModel:
         Raises:
             Exception: Se ocorrer um erro durante a conversão.
         """
-        if visited is None:
-            visited = set()
-        if current_depth > max_depth or id(self) in visited:
-            return self._handle_already_visited()
-
-        visited.add(id(self))
         try:
-            return self._serialize_sqlalchemy_object(visited, max_depth, current_depth) if hasattr(self, '__mapper__') else self._serialize_regular_object(visited, max_depth, current_depth)
+            return self._to_dict_iter(visited, max_depth, current_depth)
         except Exception as e:
             self._logger.error(f'Erro ao converter o objeto para dicionário: {e}')
             raise
 
-    def _handle_already_visited(self) -> Dict[str, Any]:
+    def _to_dict_iter(self, visited: Optional[Set[int]], max_depth: int, current_depth: int) -> Optional[Dict[str, Any]]:
         """
-        Manipula objetos já visitados para evitar loops de referência circular.
+        Monta o dicionário do objeto percorrendo o grafo com uma pilha explícita, sem recursão.
 
-        Returns:
-            Dict[str, Any]: Um dicionário com os atributos simples do objeto.
-        """
-        return {key: getattr(self, key, None) for key in self.__mapper__.columns.keys()}
+        Cada item da pilha é `(tipo, valor, destino, chave, profundidade)`: o resultado do valor é
+        gravado em `destino[chave]`, que já foi reservado no dicionário (ou lista) pai para preservar
+        a ordem das chaves. O tipo indica como o valor é tratado:
 
-    def _serialize_sqlalchemy_object(self, visited, max_depth, current_depth) -> Dict[str, Any]:
-        """
-        Serializa objetos gerenciados pelo SQLAlchemy, incluindo atributos e relacionamentos.
+        - 'node': objeto serializado pelas regras do BaseModel (colunas e relacionamentos, ou os
+          atributos públicos de instância de objetos não gerenciados pelo SQLAlchemy);
+        - 'obj': objeto com `to_dict`; os que sobrescrevem o método são serializados por ele;
+        - 'value': valor simples, lista, dicionário ou objeto com `to_dict`.
+
+        Os filhos de cada objeto são empilhados em ordem inversa, de modo que os objetos são visitados
+        na mesma ordem (pré-ordem) da serialização recursiva: a primeira ocorrência de um objeto é
+        expandida e as seguintes trazem só as colunas.
+
+        Os objetos visitados são marcados com o token da serialização, gravado no próprio `__dict__`
+        (`_STAMP_KEY`), o que dispensa o conjunto de IDs; as marcas são removidas ao final. Um conjunto
+        `visited` informado pelo chamador continua sendo respeitado e atualizado.
 
         Args:
-            visited (Set[int]): Conjunto de objetos já visitados para evitar loops.
-            max_depth (int): Profundidade máxima de aninhamento ao serializar.
-            current_depth (int): Profundidade atual de aninhamento.
+            visited (Optional[Set[int]]): Conjunto opcional de IDs de objetos já visitados.
+            max_depth (int): Profundidade máxima de aninhamento ao serializar relacionamentos.
+            current_depth (int): Profundidade do próprio objeto.
 
         Returns:
-            Dict[str, Any]: Um dicionário com os dados do objeto e seus relacionamentos.
+            Optional[Dict[str, Any]]: O dicionário que representa o objeto.
         """
-        result = {key: getattr(self, key) for key in self.__mapper__.columns.keys()}
-        for rel in self.__mapper__.relationships:
-            value = getattr(self, rel.key)
-            result[rel.key] = self._serialize_relationship(value, visited, max_depth, current_depth)
-        return result
+        if current_depth > max_depth:
+            return self._handle_already_visited()
 
-    def _serialize_relationship(self, value, visited, max_depth, current_depth):
+        token = next(_stamp_counter)
+        stamped = []
+        root = [None]
+        stack = [('node', self, root, 0, current_depth)]
+        try:
+            self._walk_to_dict(stack, token, stamped, visited, max_depth)
+        finally:
+            for obj in stamped:
+                obj.__dict__.pop(_STAMP_KEY, None)
+        return root[0]
+
+    def _walk_to_dict(self, stack: list, token: int, stamped: list, visited: Optional[Set[int]], max_depth: int):
         """
-        Serializa relacionamentos, cuidando de objetos aninhados e listas de objetos.
+        Processa a pilha de `_to_dict_iter` até esvaziá-la, marcando os objetos visitados com o token.
 
         Args:
-            value (Any): O valor do relacionamento a ser serializado.
-            visited (Set[int]): Conjunto de objetos já visitados.
-            max_depth (int): Profundidade máxima permitida.
-            current_depth (int): Profundidade atual.
-
-        Returns:
-            Any: O relacionamento serializado ou None se a profundidade for excedida.
+            stack (list): Pilha de itens `(tipo, valor, destino, chave, profundidade)`.
+            token (int): Token da serialização atual.
+            stamped (list): Lista onde os objetos marcados são acumulados, para a remoção das marcas.
+            visited (Optional[Set[int]]): Conjunto opcional de IDs de objetos já visitados.
+            max_depth (int): Profundidade máxima de aninhamento ao serializar relacionamentos.
         """
-        if value is None:
-            return None
-        if isinstance(value, list):
-            return [item.to_dict(visited, max_depth, current_depth + 1) for item in value]
-        return value.to_dict(visited, max_depth, current_depth + 1)
+        # Os limites de profundidade são verificados antes de empilhar cada filho: valores além do
+        # limite ficam com o None já reservado e objetos do BaseModel recebem apenas as suas colunas
+        while stack:
+            kind, value, target, key, depth = stack.pop()
+            child_depth = depth + 1
 
-    def _serialize_regular_object(self, visited, max_depth, current_depth) -> Dict[str, Any]:
-        """
-        Serializa objetos regulares que não são gerenciados pelo SQLAlchemy.
+            if kind == 'value':
+                if isinstance(value, (str, int, float, bool, type(None))):
+                    target[key] = value
+                elif isinstance(value, list):
+                    items = target[key] = [None] * len(value)
+                    if child_depth <= max_depth:
+                        stack.extend(('value', item, items, index, child_depth) for index, item in reversed(list(enumerate(value))))
+                elif isinstance(value, dict):
+                    items = target[key] = dict.fromkeys(value)
+                    if child_depth <= max_depth:
+                        stack.extend(('value', item, items, item_key, child_depth) for item_key, item in reversed(list(value.items())))
+                elif not hasattr(value, 'to_dict'):
+                    target[key] = None
+                elif child_depth > max_depth and type(value).to_dict is BaseModel.to_dict:
+                    target[key] = value._handle_already_visited()
+                else:
+                    stack.append(('obj', value, target, key, child_depth))
+                continue
 
-        Args:
-            visited (Set[int]): Conjunto de objetos já visitados.
-            max_depth (int): Profundidade máxima permitida.
-            current_depth (int): Profundidade atual.
+            if kind == 'obj' and (not isinstance(value, BaseModel) or type(value).to_dict is not BaseModel.to_dict):
+                target[key] = value.to_dict(visited, max_depth, depth)
+                continue
 
-        Returns:
-            Dict[str, Any]: O dicionário com os dados do objeto.
-        """
-        return {key: self._serialize_value(getattr(self, key), visited, max_depth, current_depth + 1) for key in dir(self) if not key.startswith('_') and not callable(getattr(self, key))}
+            attrs = value.__dict__
+            if attrs.get(_STAMP_KEY) == token or (visited and id(value) in visited):
+                target[key] = value._handle_already_visited()
+                continue
+            attrs[_STAMP_KEY] = token
+            stamped.append(value)
+            if visited is not None:
+                visited.add(id(value))
 
-    def _serialize_value(self, value, visited, max_depth, current_depth):
-        """
-        Serializa valores individuais do objeto, incluindo listas, dicionários e valores simples.
+            children = []
+            if hasattr(value, '__mapper__'):
+                result = target[key] = value._column_dict_function()(value)
+                for rel_key in value._rel_keys():
+                    related = getattr(value, rel_key)
+                    if related is None:
+                        result[rel_key] = None
+                    elif isinstance(related, list):
+                        items = result[rel_key] = [None] * len(related)
+                        for index, item in enumerate(related):
+                            if child_depth > max_depth and type(item).to_dict is BaseModel.to_dict:
+                                items[index] = item._handle_already_visited()
+                            else:
+                                children.append(('obj', item, items, index, child_depth))
+                    elif child_depth > max_depth and type(related).to_dict is BaseModel.to_dict:
+                        result[rel_key] = related._handle_already_visited()
+                    else:
+                        result[rel_key] = None
+                        children.append(('obj', related, result, rel_key, child_depth))
+            else:
+                result = target[key] = {}
+                for attr, attr_value in vars(value).items():
+                    if not attr.startswith('_') and not callable(attr_value):
+                        result[attr] = None
+                        if child_depth <= max_depth:
+                            children.append(('value', attr_value, result, attr, child_depth))
+            stack.extend(reversed(children))
 
-        Args:
-            value (Any): O valor a ser serializado.
-            visited (Set[int]): Conjunto de objetos já visitados.
-            max_depth (int): Profundidade máxima permitida.
-            current_depth (int): Profundidade atual.
+    def _handle_already_visited(self) -> Dict[str, Any]:
+        """
+        Manipula objetos já visitados para evitar loops de referência circular.
 
         Returns:
-            Any: O valor serializado ou None se a profundidade for excedida.
+            Dict[str, Any]: Um dicionário com os atributos simples do objeto.
         """
-        if current_depth > max_depth:
-            return None
-        if isinstance(value, (str, int, float, bool, type(None))):
-            return value
-        if isinstance(value, list):
-            return [self._serialize_value(item, visited, max_depth, current_depth + 1) for item in value]
-        if isinstance(value, dict):
-            return {k: self._serialize_value(v, visited, max_depth, current_depth + 1) for k, v in value.items()}
-        if hasattr(value, 'to_dict'):
-            return value.to_dict(visited, max_depth, current_depth + 1)
-        return None
\ No newline at end of file
+        return self._column_dict_function()(self)
\ No newline at end of file
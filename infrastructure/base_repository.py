@@ -4,13 +4,36 @@ from exception.error_invalid_object import ErrorInvalidObject
 from exception.error_object_already_exists import ErrorObjectAlreadyExist
 from infrastructure.base_model import BaseModel
 from model.page import Page
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
-from typing import Type, TypeVar, Generic, Optional, Dict, Any, List
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError, StatementError
+from sqlalchemy import String, delete, func, insert, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import MANYTOONE, Session, joinedload, make_transient_to_detached, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.instrumentation import manager_of_class
+from typing import Type, TypeVar, Generic, Optional, Dict, Any, Iterator, List, Tuple
 import logging
 
 T = TypeVar('T', bound=BaseModel)
 
+# Construtores de INSERT com suporte a ON CONFLICT DO NOTHING, por dialeto
+ON_CONFLICT_INSERTS = {'postgresql': pg_insert, 'sqlite': sqlite_insert}
+
+# Opção de execução das instruções em massa cujos registros afetados são conhecidos (pelo ID) e removidos
+# do cache pelo serviço; as demais instruções de UPDATE/DELETE descartam todo o cache do modelo
+IDS_KNOWN = 'ids_known'
+
+# Exceção lançada para cada violação de integridade, pelo SQLSTATE (PostgreSQL) ou pelo nome do erro (SQLite)
+INTEGRITY_ERRORS = {
+    '23505': ErrorObjectAlreadyExist,  # unique_violation
+    '23514': ErrorInvalidObject,  # check_violation
+    '23502': ErrorInvalidObject,  # not_null_violation
+    'SQLITE_CONSTRAINT_UNIQUE': ErrorObjectAlreadyExist,
+    'SQLITE_CONSTRAINT_PRIMARYKEY': ErrorObjectAlreadyExist,
+    'SQLITE_CONSTRAINT_CHECK': ErrorInvalidObject,
+    'SQLITE_CONSTRAINT_NOTNULL': ErrorInvalidObject,
+}
+
 
 class BaseRepository(Generic[T]):
     """
@@ -24,9 +47,18 @@ class BaseRepository(Generic[T]):
 
     Attributes:
         model (Type[T]): O modelo SQLAlchemy associado ao repositório.
+        SEARCH_SEPARATOR (str): Separador das colunas concatenadas na busca por texto.
+        BULK_BATCH_SIZE (int): Número máximo de linhas por INSERT na criação em lote.
+        STREAM_BATCH_SIZE (int): Número de registros lidos por lote na listagem sem paginação.
+        LIST_OPTIONS (tuple): Opções de carregamento (por exemplo, `selectinload`) aplicadas às listagens,
+                              para carregar os relacionamentos de todos os registros de uma vez.
         _logger (logging.Logger): Logger para registrar informações e erros.
     """
 
+    SEARCH_SEPARATOR = '\x1f'  # Separa as colunas concatenadas na busca por texto
+    BULK_BATCH_SIZE = 10000  # Linhas por INSERT em create_many
+    STREAM_BATCH_SIZE = 1000  # Registros por lote lido em iter_all
+    LIST_OPTIONS: tuple = ()  # Carregamento antecipado dos relacionamentos nas listagens
     _logger: logging.Logger
 
     def __init__(self):
@@ -35,11 +67,29 @@ class BaseRepository(Generic[T]):
         """
         self.model: Type[T] = self.__orig_bases__[0].__args__[0]
         self._logger = logging.getLogger(self.__class__.__name__)
+        # Colunas que podem ser alteradas pelo update; a chave primária nunca é alterada
+        self._settable_columns = frozenset(self.model._col_keys()) - {'id'}
+        # Consulta das colunas de resumo (`__summary_columns__`), montada uma única vez
+        summary_columns = getattr(self.model, '__summary_columns__', None)
+        self._summary_stmt = None
+        if summary_columns:
+            columns = [self.model.__table__.columns[name] for name in summary_columns]
+            self._summary_stmt = select(*columns).order_by(self.model.id)
+        self._class_manager = manager_of_class(self.model)  # Cria instâncias sem chamar o construtor, em restore
+        self._core_delete: Optional[bool] = None  # Calculado no primeiro delete, com os mappers já configurados
+        # Colunas de texto da tabela, resolvidas uma única vez por repositório (Text e Enum herdam de String)
+        self._string_columns = tuple(
+            column for column in self.model.__table__.columns if isinstance(column.type, String)
+        )
+        self._search_expr = self._search_expression()
 
     def get_by_id(self, id: int, relationships: Optional[List[str]] = None) -> Optional[T]:
         """
         Recupera um registro pelo seu ID, opcionalmente carregando relacionamentos especificados.
 
+        Relacionamentos do tipo coleção são carregados com `selectinload` e os de um único objeto com
+        `joinedload`. Um registro já presente no identity map da sessão é retornado sem consulta.
+
         Args:
             id (int): ID do registro a ser recuperado.
             relationships (Optional[List[str]]): Lista de nomes de relacionamentos a serem carregados.
@@ -52,25 +102,70 @@ class BaseRepository(Generic[T]):
         """
         session: Session = db.session
         try:
-            query = session.query(self.model)
+            options = []
             if relationships:
+                rel_meta = self.model._rel_meta()
                 for rel in relationships:
-                    query = query.options(joinedload(rel))
-            result = query.get(id)
-            return result
+                    # Coleções são carregadas por uma consulta IN separada, sem multiplicar as linhas do registro
+                    loader = selectinload if rel_meta[rel][1] else joinedload
+                    options.append(loader(getattr(self.model, rel)))
+            return session.get(self.model, id, options=options)
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em get_by_id: {str(e)}")
+            self._logger.error("Erro em get_by_id: %s", e)
             raise ErrorExecution(e)
 
-    def get_all(self, page_number: int = 1, page_size: int = 10, filter_str: Optional[str] = None) -> Page:
+    def snapshot(self, record: T) -> Dict[str, Any]:
+        """
+        Copia os valores das colunas já carregadas de um registro, sem os relacionamentos.
+
+        Args:
+            record (T): Instância do modelo.
+
+        Returns:
+            Dict[str, Any]: Os valores das colunas, indexados pelo nome.
+        """
+        state = record.__dict__
+        return {key: state[key] for key in self.model._col_keys() if key in state}
+
+    def restore(self, values: Dict[str, Any]) -> T:
+        """
+        Recria um registro a partir dos valores copiados por `snapshot`, associado à sessão atual sem consultar o banco.
+
+        Se o registro já estiver no identity map da sessão, essa instância é retornada. Os relacionamentos
+        não são copiados e são carregados sob demanda, a partir do banco.
+
+        Args:
+            values (Dict[str, Any]): Valores das colunas do registro.
+
+        Returns:
+            T: A instância persistente do modelo.
+        """
+        session: Session = db.session
+        record = session.identity_map.get(session.identity_key(self.model, values['id']))
+        if record is None:
+            # Os valores vêm do próprio banco: a instância é criada sem passar pelo construtor, e as colunas
+            # são atribuídas diretamente, como faz o carregamento do ORM, sem eventos de atributo por campo
+            record = self._class_manager.new_instance()
+            record.__dict__.update(values)
+            make_transient_to_detached(record)
+            session.add(record)
+        return record
+
+    def get_all(self, page_number: int = 1, page_size: int = 10, filter_str: Optional[str] = None,
+                cursor: Optional[int] = None) -> Page:
         """
         Recupera todos os registros com suporte a paginação e filtragem por string.
 
+        Com `cursor`, a página é obtida por keyset (`WHERE id > :cursor ORDER BY id LIMIT :n`), cujo custo
+        não cresce com a profundidade da página; nesse modo o total de itens não é contado. Sem `cursor`,
+        a paginação continua por número de página (OFFSET/LIMIT).
+
         Args:
             page_number (int, optional): Número da página a ser recuperada. Padrão é 1.
             page_size (int, optional): Número de itens por página. Padrão é 10.
             filter_str (Optional[str], optional): String para filtrar os registros. Filtra em colunas de string.
+            cursor (Optional[int], optional): ID do último registro da página anterior, na paginação por cursor.
 
         Returns:
             Page: Objeto `Page` contendo os registros, informações de paginação e total de itens.
@@ -80,46 +175,147 @@ class BaseRepository(Generic[T]):
         """
         session: Session = db.session
         try:
-            query = session.query(self.model)
-            if filter_str:
-                filter_clauses = [
-                    column.ilike(f'%{filter_str}%') 
-                    for column in self.model.__table__.columns 
-                    if hasattr(column.type, 'python_type') and issubclass(column.type.python_type, str)
-                ]
-                if filter_clauses:
-                    query = query.filter(db.or_(*filter_clauses))
-            total_items = query.count()
-            records = query.offset((page_number - 1) * page_size).limit(page_size).all()
+            # As consultas são montadas por lambdas: o SQL compilado fica em cache e, a cada chamada,
+            # apenas os parâmetros (filtro, limite e deslocamento) são extraídos
+            model = self.model
+            offset = (page_number - 1) * page_size
+            search_expr = self._search_expr if filter_str else None
+            pattern = f'%{filter_str}%'
+            list_options = self.LIST_OPTIONS
+            if cursor is not None:
+                stmt = lambda_stmt(lambda: select(model))
+                if list_options:
+                    stmt += lambda s: s.options(*list_options)
+                if search_expr is not None:
+                    stmt += lambda s: s.where(search_expr.ilike(pattern))
+                # Um registro a mais indica se existe uma próxima página
+                stmt += lambda s: s.where(model.id > cursor).order_by(model.id).limit(page_size + 1)
+                records = session.scalars(stmt).all()
+                next_cursor = None
+                if len(records) > page_size:
+                    records = records[:page_size]
+                    next_cursor = records[-1].id
+                return Page(records, page_number, page_size, None, next_cursor)
+
+            # O total vem na mesma consulta, por uma função de janela calculada antes do LIMIT/OFFSET
+            stmt = lambda_stmt(lambda: select(model, func.count().over()))
+            if list_options:
+                stmt += lambda s: s.options(*list_options)
+            if search_expr is not None:
+                stmt += lambda s: s.where(search_expr.ilike(pattern))
+            # Ordenação explícita pela chave primária: sem ela, as páginas do OFFSET não são estáveis
+            stmt += lambda s: s.order_by(model.id).offset(offset).limit(page_size)
+            rows = session.execute(stmt).all()
+            if rows:
+                total_items = rows[0][1]
+            elif offset > 0:
+                # Página vazia: sem linhas, o total só pode ser obtido por uma contagem separada
+                count_stmt = lambda_stmt(lambda: select(func.count()).select_from(model))
+                if search_expr is not None:
+                    count_stmt += lambda s: s.where(search_expr.ilike(pattern))
+                total_items = session.scalar(count_stmt)
+            else:
+                total_items = 0
+            records = [row[0] for row in rows]
             return Page(records, page_number, page_size, total_items)
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em get_all: {str(e)}")
+            self._logger.error("Erro em get_all: %s", e)
             raise ErrorExecution(e)
 
-    def get_all_without_pagination(self) -> List[T]:
+    def _search_expression(self):
         """
-        Recupera todos os registros sem aplicar paginação.
+        Monta a expressão pesquisada pelo filtro da listagem paginada.
+
+        As colunas vêm do atributo `__search_columns__` do modelo ou, na falta dele, de todas as colunas
+        de texto da tabela (`_string_columns`). Com mais de uma coluna, os valores são concatenados (nulos viram texto vazio)
+        com um separador que não aparece nos filtros, de modo que um único ILIKE avalia todas as colunas,
+        sem um termo casar com o fim de uma coluna e o início da seguinte.
 
         Returns:
-            List[T]: Lista de instâncias do modelo.
+            Optional[ColumnElement]: A expressão a ser comparada com o filtro, ou `None` se o modelo
+            não tiver colunas de texto.
+        """
+        names = getattr(self.model, '__search_columns__', None)
+        if names is not None:
+            columns = [self.model.__table__.columns[name] for name in names]
+        else:
+            columns = self._string_columns
+        if not columns:
+            return None
+        if len(columns) == 1:
+            return columns[0]
+        expression = func.coalesce(columns[0], '')
+        for column in columns[1:]:
+            expression = expression + self.SEARCH_SEPARATOR + func.coalesce(column, '')
+        return expression
+
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[T]:
+        """
+        Percorre todos os registros sem paginação, lendo-os do banco em lotes.
+
+        A consulta usa `stream_results` e `yield_per`, de modo que os registros são carregados e
+        entregues aos poucos, à medida que o iterador é consumido, em vez de materializar a tabela
+        inteira de uma vez (nos drivers com cursor de servidor, nem o driver guarda todas as linhas). Como
+        as demais listagens, é montada por `lambda_stmt`, com o SQL compilado reaproveitado.
+
+        Args:
+            batch_size (Optional[int]): Número de registros por lote. O padrão é `STREAM_BATCH_SIZE`.
+
+        Yields:
+            T: Cada instância do modelo.
 
         Raises:
             ErrorExecution: Se ocorrer um erro durante a execução da consulta.
         """
         session: Session = db.session
         try:
-            records = session.query(self.model).all()
-            return records
+            model = self.model
+            list_options = self.LIST_OPTIONS
+            stmt = lambda_stmt(lambda: select(model))
+            if list_options:
+                stmt += lambda s: s.options(*list_options)
+            execution_options = {'stream_results': True, 'yield_per': batch_size or self.STREAM_BATCH_SIZE}
+            yield from session.scalars(stmt, execution_options=execution_options)
+        except SQLAlchemyError as e:
+            session.rollback()
+            self._logger.error("Erro em iter_all: %s", e)
+            raise ErrorExecution(e)
+
+    def list_summary(self) -> List[Tuple[Any, ...]]:
+        """
+        Lista apenas as colunas de resumo (`__summary_columns__` do modelo) de todos os registros, ordenados pelo ID.
+
+        As linhas são lidas como tuplas, sem criar instâncias do modelo nem registrá-las na sessão.
+
+        Returns:
+            List[Tuple[Any, ...]]: Uma tupla por registro, com os valores das colunas de resumo.
+
+        Raises:
+            ErrorInvalidObject: Se o modelo não declarar colunas de resumo.
+            ErrorExecution: Se ocorrer um erro durante a execução da consulta.
+        """
+        if self._summary_stmt is None:
+            raise ErrorInvalidObject(f'A entidade {self.model.__name__} não possui resumo.')
+        session: Session = db.session
+        try:
+            return [tuple(row) for row in session.execute(self._summary_stmt)]
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em get_all_without_pagination: {str(e)}")
+            self._logger.error("Erro em list_summary: %s", e)
             raise ErrorExecution(e)
 
     def create(self, data: Dict[str, Any]) -> Optional[T]:
         """
         Cria um novo registro no banco de dados.
 
+        Os valores são validados contra o `__check_constraints__` do modelo antes do INSERT. Quando o
+        modelo declara `__unique_keys__` e os dados contêm apenas colunas, o registro é inserido com
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING`: uma duplicata é detectada pela ausência de linha
+        retornada, sem abortar a transação com um `IntegrityError`. Os demais modelos são inseridos com
+        `INSERT ... RETURNING`, sem o SELECT de um `refresh`; o `refresh` só é usado quando os dados contêm
+        relacionamentos ou o dialeto não suporta RETURNING.
+
         Args:
             data (Dict[str, Any]): Dicionário contendo os dados para criar o registro.
 
@@ -133,6 +329,28 @@ class BaseRepository(Generic[T]):
         """
         session: Session = db.session
         try:
+            self.check_constraints(self.model, data)
+            on_conflict_insert = self._on_conflict_insert(session, data)
+            if on_conflict_insert is not None:
+                stmt = (
+                    on_conflict_insert(self.model)
+                    .values(**data)
+                    .on_conflict_do_nothing(index_elements=self.model.__unique_keys__)
+                    .returning(self.model)
+                )
+                new_record = session.scalars(stmt).one_or_none()
+                if new_record is None:
+                    session.rollback()
+                    self._logger.warning("Registro duplicado em create: %s", data)
+                    raise ErrorObjectAlreadyExist()
+                session.commit()
+                return new_record
+
+            if set(data).issubset(self.model._col_keys()) and session.get_bind().dialect.insert_returning:
+                new_record = session.scalars(insert(self.model).values(**data).returning(self.model)).one()
+                session.commit()
+                return new_record
+
             new_record = self.model(**data)
             session.add(new_record)
             session.commit()
@@ -140,23 +358,153 @@ class BaseRepository(Generic[T]):
             return new_record
         except IntegrityError as e:
             session.rollback()
-            error_message = str(e.orig)
-            self._logger.error(f"Erro de integridade em create: {error_message}")
-            if 'UNIQUE constraint failed' in error_message:
-                raise ErrorObjectAlreadyExist(e)
-            elif 'CHECK constraint failed' in error_message:
-                raise ErrorInvalidObject(e)
-            else:
-                raise ErrorExecution(e)
+            self._raise_integrity_error(e, 'create')
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em create: {str(e)}")
-            raise ErrorExecution(e)
+            self._raise_execution_error(e, 'create')
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[T]:
+        """
+        Cria vários registros no banco de dados em lote, com uma única transação.
+
+        As linhas são inseridas por um INSERT em massa do ORM com RETURNING, em lotes de até
+        `BULK_BATCH_SIZE` linhas, em vez de um INSERT e um COMMIT por registro. Como o INSERT em massa
+        ignora as chaves que não são colunas, cada linha deve conter apenas colunas do modelo; os
+        relacionamentos só podem ser informados pelo `create` de um registro.
+
+        Args:
+            rows (List[Dict[str, Any]]): Lista de dicionários com os valores das colunas de cada registro.
+
+        Returns:
+            List[T]: Instâncias dos modelos criados, na ordem dos dados recebidos.
+
+        Raises:
+            ErrorObjectAlreadyExist: Se violar a restrição de unicidade.
+            ErrorInvalidObject: Se alguma linha não for um dicionário, contiver chaves que não são colunas
+                                ou violar a restrição de verificação (CHECK).
+            ErrorExecution: Para outros erros de execução.
+        """
+        col_keys = self.model._col_keys()
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ErrorInvalidObject("Cada item deve ser um dicionário")
+            unknown = row.keys() - col_keys
+            if unknown:
+                raise ErrorInvalidObject(f"Campos inválidos para criação em lote: {', '.join(sorted(unknown))}")
+            self.check_constraints(self.model, row)
+
+        session: Session = db.session
+        try:
+            records: List[T] = []
+            stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            for start in range(0, len(rows), self.BULK_BATCH_SIZE):
+                records.extend(session.scalars(stmt, rows[start:start + self.BULK_BATCH_SIZE]))
+            session.commit()
+            return records
+        except IntegrityError as e:
+            session.rollback()
+            self._raise_integrity_error(e, 'create_many')
+        except SQLAlchemyError as e:
+            session.rollback()
+            self._raise_execution_error(e, 'create_many')
+
+    def _on_conflict_insert(self, session: Session, data: Dict[str, Any]):
+        """
+        Retorna o construtor de INSERT com ON CONFLICT do dialeto atual, quando ele pode ser usado.
+
+        Args:
+            session (Session): Sessão atual do banco de dados.
+            data (Dict[str, Any]): Dados do registro a ser criado.
+
+        Returns:
+            Optional[Callable]: O `insert` do dialeto, ou `None` se o modelo não declarar `__unique_keys__`,
+            se os dados não contiverem todas as colunas da restrição de unicidade (não há conflito a
+            detectar, e a falta de um valor obrigatório segue pelo INSERT comum), se o dialeto não tiver
+            suporte ou se os dados contiverem chaves que não são colunas.
+        """
+        unique_keys = getattr(self.model, '__unique_keys__', None)
+        if not unique_keys or not data.keys() >= set(unique_keys):
+            return None
+        on_conflict_insert = ON_CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+        if on_conflict_insert is None or not set(data).issubset(self.model._col_keys()):
+            return None
+        return on_conflict_insert
+
+    @staticmethod
+    def check_constraints(model: Type[BaseModel], data: Dict[str, Any]) -> None:
+        """
+        Valida os dados contra os valores permitidos declarados em `__check_constraints__` no modelo.
+
+        Também usado pelos repositórios que gravam registros de outro modelo em lote (como os horários
+        de uma turma), sem passar pelo repositório desse modelo.
+
+        Args:
+            model (Type[BaseModel]): Classe do modelo dos dados.
+            data (Dict[str, Any]): Dados do registro.
+
+        Raises:
+            ErrorInvalidObject: Se alguma coluna tiver um valor fora dos permitidos.
+        """
+        for column, allowed in getattr(model, '__check_constraints__', {}).items():
+            if column in data and data[column] not in allowed:
+                raise ErrorInvalidObject(f"Valor inválido para '{column}': {data[column]}")
+
+    def _raise_integrity_error(self, error: IntegrityError, operation: str):
+        """
+        Registra um erro de integridade e lança a exceção correspondente à restrição violada.
+
+        A restrição é identificada pelo código do erro do driver, e não pelo texto da mensagem: o
+        `sqlstate` (psycopg) ou `pgcode` (psycopg2) no PostgreSQL e o `sqlite_errorname` no SQLite.
+
+        Args:
+            error (IntegrityError): O erro de integridade lançado pelo SQLAlchemy.
+            operation (str): Nome da operação, usado na mensagem de log.
+
+        Raises:
+            ErrorObjectAlreadyExist: Se violar a restrição de unicidade.
+            ErrorInvalidObject: Se violar a restrição de verificação (CHECK) ou de valor obrigatório (NOT NULL).
+            ErrorExecution: Para as demais violações de integridade.
+        """
+        orig = error.orig
+        code = getattr(orig, 'sqlstate', None) or getattr(orig, 'pgcode', None) or getattr(orig, 'sqlite_errorname', None)
+        self._logger.error("Erro de integridade em %s: %s", operation, orig)
+        error_class = INTEGRITY_ERRORS.get(code)
+        if error_class is None:
+            raise ErrorExecution(error)
+        # As violações conhecidas levam apenas a mensagem do driver, sem o SQL da instrução
+        raise error_class(str(orig))
+
+    def _raise_execution_error(self, error: SQLAlchemyError, operation: str):
+        """
+        Registra um erro de execução de uma escrita e lança a exceção correspondente.
+
+        Um valor recusado pelo tipo da coluna ao ser convertido para o banco (por exemplo, uma hora
+        inválida) chega como `StatementError` com um `ValueError` de origem; nesse caso é lançado
+        `ErrorInvalidObject` apenas com a mensagem do tipo, sem o SQL da instrução.
+
+        Args:
+            error (SQLAlchemyError): O erro lançado pelo SQLAlchemy.
+            operation (str): Nome da operação, usado na mensagem de log.
+
+        Raises:
+            ErrorInvalidObject: Se um valor foi recusado pelo tipo da coluna.
+            ErrorExecution: Para os demais erros de execução.
+        """
+        if isinstance(error, StatementError) and isinstance(error.orig, ValueError):
+            self._logger.warning("Valor inválido em %s: %s", operation, error.orig)
+            raise ErrorInvalidObject(str(error.orig))
+        self._logger.error("Erro em %s: %s", operation, error)
+        raise ErrorExecution(error)
 
     def update(self, id: int, data: Dict[str, Any]) -> Optional[T]:
         """
         Atualiza um registro existente no banco de dados.
 
+        Quando os dados contêm apenas colunas, o registro é alterado e devolvido por um único
+        `UPDATE ... RETURNING`, sem carregá-lo antes. Dados com relacionamentos, ou dialetos sem
+        suporte a RETURNING, seguem pelo ORM com `refresh` após o commit. Só as colunas de
+        `_settable_columns` e os relacionamentos do modelo são alterados; as demais chaves são ignoradas.
+
         Args:
             id (int): ID do registro a ser atualizado.
             data (Dict[str, Any]): Dicionário contendo os campos a serem atualizados.
@@ -166,6 +514,8 @@ class BaseRepository(Generic[T]):
 
         Raises:
             TypeError: Se `data` não for um dicionário.
+            ErrorInvalidObject: Se os dados violarem `__check_constraints__` ou uma restrição do banco.
+            ErrorObjectAlreadyExist: Se a atualização violar uma restrição de unicidade.
             ErrorExecution: Se o registro não for encontrado ou ocorrer um erro durante a atualização.
         """
         session: Session = db.session
@@ -173,26 +523,95 @@ class BaseRepository(Generic[T]):
             if not isinstance(data, dict):
                 raise TypeError("O parâmetro 'data' deve ser um dicionário")
 
+            rel_keys = self.model._rel_keys()
+            relationships = {key: data[key] for key in rel_keys if key in data}
+            values = {key: data[key] for key in data.keys() & self._settable_columns}
+            self.check_constraints(self.model, values)
+            if not relationships and session.get_bind().dialect.update_returning:
+                if values:
+                    stmt = (
+                        update(self.model).where(self.model.id == id).values(**values).returning(self.model)
+                        .execution_options(**{IDS_KNOWN: True})
+                    )
+                    record = session.scalars(stmt).one_or_none()
+                    if not record:
+                        raise ErrorExecution(f"Registro com ID {id} não encontrado para atualização")
+                    session.commit()
+                    return record
+
             record = session.get(self.model, id)
             if not record:
                 raise ErrorExecution(f"Registro com ID {id} não encontrado para atualização")
 
-            for key, value in data.items():
-                if hasattr(self.model, key) and key != 'materias':
-                    setattr(record, key, value)
+            for key, value in values.items():
+                setattr(record, key, value)
+            for key, value in relationships.items():
+                setattr(record, key, value)
 
             session.commit()
             session.refresh(record)
             return record
+        except IntegrityError as e:
+            session.rollback()
+            self._raise_integrity_error(e, 'update')
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em update: {str(e)}")
-            raise ErrorExecution(e)
+            self._raise_execution_error(e, 'update')
+
+    def update_many(self, rows: List[Dict[str, Any]]) -> List[T]:
+        """
+        Atualiza vários registros em lote, com uma única transação.
+
+        Cada linha traz o `id` do registro e as colunas a alterar; as linhas são enviadas por um UPDATE
+        em massa do ORM pela chave primária (executemany), em lotes de até `BULK_BATCH_SIZE` linhas. Os
+        registros atualizados são relidos ao final com uma única consulta.
+
+        Args:
+            rows (List[Dict[str, Any]]): Lista de dicionários com o `id` e os valores das colunas de cada registro.
+
+        Returns:
+            List[T]: Instâncias dos modelos atualizados, na ordem dos dados recebidos.
+
+        Raises:
+            ErrorInvalidObject: Se alguma linha não tiver `id` ou violar `__check_constraints__`.
+            ErrorExecution: Se algum registro não for encontrado ou ocorrer um erro durante a atualização.
+        """
+        values = []
+        for row in rows:
+            if not isinstance(row, dict) or 'id' not in row:
+                raise ErrorInvalidObject("Cada item deve ser um dicionário contendo o campo 'id'")
+            self.check_constraints(self.model, row)
+            values.append({key: row[key] for key in row.keys() & self._settable_columns} | {'id': row['id']})
+
+        session: Session = db.session
+        try:
+            for start in range(0, len(values), self.BULK_BATCH_SIZE):
+                session.execute(update(self.model), values[start:start + self.BULK_BATCH_SIZE],
+                                execution_options={IDS_KNOWN: True})
+            session.commit()
+            ids = [row['id'] for row in values]
+            stmt = select(self.model).where(self.model.id.in_(ids)).execution_options(populate_existing=True)
+            records = {record.id: record for record in session.scalars(stmt)}
+            return [records[id] for id in ids]
+        except StaleDataError as e:
+            session.rollback()
+            self._logger.warning("Registros não encontrados em update_many: %s", e)
+            raise ErrorExecution("Alguns registros fornecidos não foram encontrados para atualização")
+        except IntegrityError as e:
+            session.rollback()
+            self._raise_integrity_error(e, 'update_many')
+        except SQLAlchemyError as e:
+            session.rollback()
+            self._raise_execution_error(e, 'update_many')
 
     def delete(self, id: int) -> bool:
         """
         Deleta um registro do banco de dados pelo seu ID.
 
+        Se todos os relacionamentos do modelo forem muitos-para-um, não há coleções nem cascatas a
+        tratar pelo ORM, e o registro é removido por um `DELETE ... WHERE id = :id` direto, sem ser
+        carregado. Os demais modelos seguem pelo `session.delete`.
+
         Args:
             id (int): ID do registro a ser deletado.
 
@@ -204,17 +623,26 @@ class BaseRepository(Generic[T]):
         """
         session: Session = db.session
         try:
-            record = session.get(self.model, id)
-            if record:
-                session.delete(record)
+            if self._core_delete is None:
+                self._core_delete = all(rel.direction is MANYTOONE for rel in self.model.__mapper__.relationships)
+            if self._core_delete:
+                stmt = delete(self.model).where(self.model.id == id).execution_options(**{IDS_KNOWN: True})
+                deleted = session.execute(stmt).rowcount > 0
                 session.commit()
-                self._logger.info(f"Registro com ID {id} deletado com sucesso.")
+            else:
+                record = session.get(self.model, id)
+                deleted = record is not None
+                if deleted:
+                    session.delete(record)
+                    session.commit()
+            if deleted:
+                self._logger.info("Registro com ID %s deletado com sucesso.", id)
                 return True
-            self._logger.warning(f"Registro com ID {id} não encontrado para deleção.")
+            self._logger.warning("Registro com ID %s não encontrado para deleção.", id)
             return False
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em delete: {str(e)}")
+            self._logger.error("Erro em delete: %s", e)
             raise ErrorExecution(e)
 
     def count_all(self) -> int:
@@ -229,9 +657,10 @@ class BaseRepository(Generic[T]):
         """
         session: Session = db.session
         try:
-            total_count = session.query(self.model).count()
+            model = self.model
+            total_count = session.scalar(lambda_stmt(lambda: select(func.count()).select_from(model)))
             return total_count
         except SQLAlchemyError as e:
             session.rollback()
-            self._logger.error(f"Erro em count_all: {str(e)}")
+            self._logger.error("Erro em count_all: %s", e)
             raise ErrorExecution(e)
\ No newline at end of file
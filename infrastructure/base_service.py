@@ -1,3 +1,4 @@
+from config.globals import db
 from exception.error_creation import ErrorCreation
 from exception.error_delete import ErrorDelete
 from exception.error_execution import ErrorExecution
@@ -6,10 +7,14 @@ from exception.error_not_found import ErrorNotFound
 from exception.error_object_already_exists import ErrorObjectAlreadyExist
 from exception.error_update import ErrorUpdate
 from infrastructure.base_model import BaseModel
-from infrastructure.base_repository import BaseRepository
+from cachetools import TTLCache
+from infrastructure.base_repository import IDS_KNOWN, BaseRepository
 from model.page import Page
-from typing import Optional, TypeVar, Generic, Dict, Any, List
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session
+from typing import Optional, TypeVar, Generic, Dict, Any, Iterator, List, Tuple
 import logging
+import threading
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -19,7 +24,23 @@ class BaseService(Generic[T]):
     
     Esta classe implementa os métodos comuns a serem utilizados por serviços de várias entidades, como buscar,
     criar, atualizar e deletar itens, além de fornecer suporte para paginação e manipulação de exceções.
+
+    Attributes:
+        CACHE_MAX_SIZE (int): Número máximo de itens guardados no cache de `get_by_id`.
+        CACHE_TTL (int): Tempo, em segundos, que um item permanece no cache de `get_by_id`.
+        COUNT_CACHE_TTL (int): Tempo, em segundos, que o total de registros de `count_all` permanece em cache.
+        COUNT_CACHE_MAX_SIZE (int): Número máximo de bancos de dados com o total guardado por `count_all`.
+
+    As entradas dos caches são indexadas pelo engine do banco de dados, além do ID: aplicações criadas no
+    mesmo processo com bancos diferentes não compartilham os valores guardados.
     """
+    CACHE_MAX_SIZE = 10000
+    CACHE_TTL = 60
+    COUNT_CACHE_TTL = 5
+    COUNT_CACHE_MAX_SIZE = 16
+    _instances: Dict[type, 'BaseService'] = {}  # Instância única de cada serviço, criada por instance()
+    _services_by_mapper: Dict[Mapper, 'BaseService'] = {}  # Serviço de cada modelo, usado por _on_orm_execute
+    _instances_lock = threading.Lock()
     _logger: logging.Logger
 
     def __init__(self, repository: BaseRepository[T]):
@@ -31,11 +52,42 @@ class BaseService(Generic[T]):
         """
         self.repository = repository
         self._logger = logging.getLogger(self.__class__.__name__)
+        self._cache = TTLCache(maxsize=self.CACHE_MAX_SIZE, ttl=self.CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        self._count_cache = TTLCache(maxsize=self.COUNT_CACHE_MAX_SIZE, ttl=self.COUNT_CACHE_TTL)  # Total por engine
+        # Alterações feitas pelo ORM em qualquer ponto da aplicação também invalidam os caches
+        event.listen(repository.model, 'after_insert', self._on_record_inserted)
+        event.listen(repository.model, 'after_update', self._on_record_changed)
+        event.listen(repository.model, 'after_delete', self._on_record_deleted)
+        BaseService._services_by_mapper[repository.model.__mapper__] = self
+
+    @classmethod
+    def instance(cls) -> 'BaseService[T]':
+        """
+        Retorna a instância única do serviço no processo, criando-a na primeira chamada.
+
+        O serviço guarda o repositório (com as suas consultas e colunas já resolvidas), o cache de
+        `get_by_id` e os eventos registrados no SQLAlchemy; criar novas instâncias repetiria esse
+        trabalho e registraria os eventos novamente.
+
+        Returns:
+            BaseService[T]: A instância do serviço.
+        """
+        service = cls._instances.get(cls)
+        if service is None:
+            with cls._instances_lock:
+                service = cls._instances.get(cls)
+                if service is None:
+                    service = cls._instances[cls] = cls()
+        return service
 
     def get_by_id(self, id: int) -> Optional[T]:
         """
         Busca um item pelo ID.
 
+        Os valores das colunas ficam em um cache em memória por `CACHE_TTL` segundos; enquanto válidos, o
+        item é recriado na sessão sem consultar o banco. Os relacionamentos sempre são lidos do banco.
+
         Args:
             id (int): O ID do item a ser buscado.
 
@@ -45,13 +97,23 @@ class BaseService(Generic[T]):
         Raises:
             ErrorNotFound: Se o item com o ID fornecido não for encontrado.
         """
+        key = (db.engine, id)
+        with self._cache_lock:
+            values = self._cache.get(key)
+        if values is not None:
+            return self.repository.restore(values)
+
         result = self.repository.get_by_id(id)
         if not result:
             self._log_and_raise_warning(ErrorNotFound, f'Item com ID {id} não foi encontrado.')
-        self._logger.debug(f'Item encontrado: {result}')
+        values = self.repository.snapshot(result)
+        with self._cache_lock:
+            self._cache[key] = values
+        self._logger.debug('Item encontrado: %s', result)
         return result
 
-    def get_all(self, page_number: int = 1, page_size: int = 10, filter_str: Optional[str] = None) -> Page:
+    def get_all(self, page_number: int = 1, page_size: int = 10, filter_str: Optional[str] = None,
+                cursor: Optional[int] = None) -> Page:
         """
         Busca itens com paginação e filtro opcional.
 
@@ -59,6 +121,7 @@ class BaseService(Generic[T]):
             page_number (int): Número da página para paginação.
             page_size (int): Número de itens por página.
             filter_str (Optional[str]): Filtro opcional para a busca.
+            cursor (Optional[int]): ID do último item da página anterior, para a paginação por cursor.
 
         Returns:
             Page: Um objeto contendo a página com os itens e a contagem total.
@@ -67,27 +130,49 @@ class BaseService(Generic[T]):
             ErrorExecution: Se ocorrer um erro durante a execução da busca.
         """
         try:
-            results = self.repository.get_all(page_number, page_size, filter_str)
-            self._logger.debug(f'Total de itens encontrados: {results.total_items}')
+            results = self.repository.get_all(page_number, page_size, filter_str, cursor)
+            self._logger.debug('Total de itens encontrados: %s', results.total_items)
             return results
         except Exception as e:
             self._log_and_raise_error(ErrorExecution, 'Erro ao buscar itens.', e)
 
-    def get_all_without_pagination(self) -> List[T]:
+    def get_all_without_pagination(self) -> Iterator[T]:
         """
-        Busca todos os itens sem paginação.
+        Percorre todos os itens sem paginação.
 
-        Returns:
-            List[T]: Lista de todos os itens.
+        Os itens são lidos do banco em lotes, à medida que o iterador é consumido.
+
+        Yields:
+            T: Cada item.
 
         Raises:
             ErrorExecution: Se ocorrer um erro durante a execução da busca.
         """
         try:
-            return self.repository.get_all_without_pagination()
+            yield from self.repository.iter_all()
         except Exception as e:
             self._log_and_raise_error(ErrorExecution, 'Erro ao buscar todos os itens.', e)
 
+    def list_summary(self) -> List[Tuple[Any, ...]]:
+        """
+        Lista o resumo (por exemplo, `id` e `nome`) de todos os itens, sem carregar as entidades.
+
+        Returns:
+            List[Tuple[Any, ...]]: Uma tupla por item, com os valores das colunas de resumo.
+
+        Raises:
+            ErrorInvalidObject: Se a entidade não possuir resumo.
+            ErrorExecution: Se ocorrer um erro durante a execução da busca.
+        """
+        try:
+            results = self.repository.list_summary()
+            self._logger.debug('Total de itens no resumo: %s', len(results))
+            return results
+        except ErrorInvalidObject as e:
+            self._log_and_raise_warning(ErrorInvalidObject, str(e), e)
+        except Exception as e:
+            self._log_and_raise_error(ErrorExecution, 'Erro ao buscar o resumo dos itens.', e)
+
     def create(self, data: Dict[str, Any]) -> Optional[T]:
         """
         Cria um novo item.
@@ -104,13 +189,39 @@ class BaseService(Generic[T]):
         """
         try:
             result = self.repository.create(data)
-            self._logger.debug(f'Item criado com sucesso: {result}')
+            self._logger.debug('Item criado com sucesso: %s', result)
             return result
         except ErrorObjectAlreadyExist as e:
             self._log_and_raise_warning(ErrorObjectAlreadyExist, 'O item já existe.', e)
         except Exception as e:
             self._log_and_raise_error(ErrorCreation, 'Erro ao criar item.', e)
 
+    def create_many(self, data_list: List[Dict[str, Any]]) -> List[T]:
+        """
+        Cria vários itens em lote.
+
+        Args:
+            data_list (List[Dict[str, Any]]): Dados dos novos itens a serem criados.
+
+        Returns:
+            List[T]: Os itens criados, na ordem dos dados recebidos.
+
+        Raises:
+            ErrorInvalidObject: Se os dados fornecidos para criação forem inválidos.
+            ErrorObjectAlreadyExist: Se algum dos itens já existir.
+            ErrorCreation: Se ocorrer um erro durante a criação dos itens.
+        """
+        try:
+            results = self.repository.create_many(data_list)
+            self._logger.debug('%s itens criados com sucesso.', len(results))
+            return results
+        except ErrorInvalidObject as e:
+            self._log_and_raise_warning(ErrorInvalidObject, f'Dados inválidos fornecidos para criação: {e}', e)
+        except ErrorObjectAlreadyExist as e:
+            self._log_and_raise_warning(ErrorObjectAlreadyExist, 'Um ou mais itens já existem.', e)
+        except Exception as e:
+            self._log_and_raise_error(ErrorCreation, 'Erro ao criar itens.', e)
+
     def update(self, id: int, data: Dict[str, Any]) -> Optional[T]:
         """
         Atualiza um item existente.
@@ -125,19 +236,56 @@ class BaseService(Generic[T]):
         Raises:
             ErrorNotFound: Se o item com o ID fornecido não for encontrado.
             ErrorInvalidObject: Se os dados fornecidos para atualização forem inválidos.
+            ErrorObjectAlreadyExist: Se a atualização violar a restrição de unicidade.
             ErrorUpdate: Se ocorrer um erro durante a atualização.
         """
         try:
             result = self.repository.update(id, data)
             if result:
-                self._logger.debug(f'Item atualizado com sucesso: {result}')
+                self._logger.debug('Item atualizado com sucesso: %s', result)
             else:
                 self._log_and_raise_warning(ErrorNotFound, f'Item com ID {id} não foi encontrado para atualização.')
             return result
         except ErrorInvalidObject as e:
             self._log_and_raise_warning(ErrorInvalidObject, 'Dados inválidos fornecidos para atualização.', e)
+        except ErrorObjectAlreadyExist as e:
+            self._log_and_raise_warning(ErrorObjectAlreadyExist, 'O item já existe.', e)
         except Exception as e:
             self._log_and_raise_error(ErrorUpdate, 'Erro ao atualizar item.', e)
+        finally:
+            # Descartado após o commit: uma leitura feita antes dele pode ter guardado o valor antigo
+            self._invalidate(id)
+
+    def update_many(self, data_list: List[Dict[str, Any]]) -> List[T]:
+        """
+        Atualiza vários itens em lote.
+
+        Args:
+            data_list (List[Dict[str, Any]]): Dados atualizados dos itens, cada um com o seu `id`.
+
+        Returns:
+            List[T]: Os itens atualizados, na ordem dos dados recebidos.
+
+        Raises:
+            ErrorInvalidObject: Se os dados fornecidos para atualização forem inválidos.
+            ErrorObjectAlreadyExist: Se algum dos itens violar a restrição de unicidade.
+            ErrorUpdate: Se algum item não for encontrado ou ocorrer um erro durante a atualização.
+        """
+        try:
+            results = self.repository.update_many(data_list)
+            self._logger.debug('%s itens atualizados com sucesso.', len(results))
+            return results
+        except ErrorInvalidObject as e:
+            self._log_and_raise_warning(ErrorInvalidObject, 'Dados inválidos fornecidos para atualização.', e)
+        except ErrorObjectAlreadyExist as e:
+            self._log_and_raise_warning(ErrorObjectAlreadyExist, 'Um ou mais itens já existem.', e)
+        except Exception as e:
+            self._log_and_raise_error(ErrorUpdate, 'Erro ao atualizar itens.', e)
+        finally:
+            # O UPDATE em massa pela chave primária não descarta o cache: os IDs são removidos aqui, após o commit
+            for row in data_list:
+                if isinstance(row, dict) and 'id' in row:
+                    self._invalidate(row['id'])
 
     def delete(self, id: int) -> bool:
         """
@@ -156,12 +304,77 @@ class BaseService(Generic[T]):
         try:
             success = self.repository.delete(id)
             if success:
-                self._logger.debug(f'Item com ID {id} deletado com sucesso.')
+                self._logger.debug('Item com ID %s deletado com sucesso.', id)
             else:
                 self._log_and_raise_warning(ErrorNotFound, f'Item com ID {id} não foi encontrado para exclusão.')
             return success
         except Exception as e:
             self._log_and_raise_error(ErrorDelete, 'Erro ao deletar item.', e)
+        finally:
+            # Descartado após o commit: uma leitura feita antes dele pode ter guardado o valor antigo
+            self._invalidate(id)
+
+    def _invalidate(self, id: int, engine=None) -> None:
+        """
+        Remove um item do cache de `get_by_id`.
+
+        Args:
+            id (int): O ID do item.
+            engine (Optional[Engine]): O engine do banco do item. O padrão é o da aplicação atual.
+        """
+        key = (engine or db.engine, id)
+        with self._cache_lock:
+            self._cache.pop(key, None)
+
+    def _invalidate_count(self) -> None:
+        """
+        Descarta os totais de registros guardados por `count_all`.
+        """
+        with self._cache_lock:
+            self._count_cache.clear()
+
+    def _on_record_inserted(self, mapper, connection, target: T) -> None:
+        """
+        Evento do SQLAlchemy disparado após o INSERT de um registro pelo ORM; descarta o total em cache.
+        """
+        self._invalidate_count()
+
+    def _on_record_changed(self, mapper, connection, target: T) -> None:
+        """
+        Evento do SQLAlchemy disparado após o UPDATE de um registro pelo ORM; remove o registro do cache.
+        """
+        self._invalidate(target.id, connection.engine)
+
+    def _on_record_deleted(self, mapper, connection, target: T) -> None:
+        """
+        Evento do SQLAlchemy disparado após o DELETE de um registro pelo ORM; remove o registro do cache
+        e descarta o total em cache.
+        """
+        self._invalidate(target.id, connection.engine)
+        self._invalidate_count()
+
+    @classmethod
+    def _on_orm_execute(cls, orm_execute_state: ORMExecuteState) -> None:
+        """
+        Evento do SQLAlchemy disparado a cada instrução executada pelo ORM, registrado uma única vez para
+        todos os serviços; a instrução é encaminhada ao serviço do modelo afetado.
+
+        Um UPDATE ou DELETE em massa não dispara os eventos por registro; quando os registros afetados não
+        são conhecidos (sem a opção `IDS_KNOWN`, como na troca dos horários de uma turma), todo o cache do
+        serviço é descartado. Com a opção, o próprio serviço remove os IDs após o commit. Um INSERT ou
+        DELETE (inclusive os feitos pelo Core, como em `create` e `create_many`) descarta o total em cache.
+        """
+        if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        service = cls._services_by_mapper.get(orm_execute_state.bind_mapper)
+        if service is None:
+            return
+        ids_known = orm_execute_state.execution_options.get(IDS_KNOWN, False)
+        with service._cache_lock:
+            if (orm_execute_state.is_update or orm_execute_state.is_delete) and not ids_known:
+                service._cache.clear()
+            if orm_execute_state.is_insert or orm_execute_state.is_delete:
+                service._count_cache.clear()
 
     def _log_and_raise_warning(self, error_class, message: str, exception: Optional[Exception] = None):
         """
@@ -192,15 +405,28 @@ class BaseService(Generic[T]):
         """
         Conta o número total de registros.
 
+        O total fica em cache por `COUNT_CACHE_TTL` segundos e é descartado a cada inclusão ou exclusão
+        de registros do modelo; dentro dessa janela, a contagem não é repetida no banco.
+
         Returns:
             int: O número total de registros.
 
         Raises:
             ErrorExecution: Se ocorrer um erro durante a execução da contagem.
         """
+        with self._cache_lock:
+            total_count = self._count_cache.get(db.engine)
+        if total_count is not None:
+            return total_count
         try:
             total_count = self.repository.count_all()
-            self._logger.debug(f'Total de registros: {total_count}')
+            with self._cache_lock:
+                self._count_cache[db.engine] = total_count
+            self._logger.debug('Total de registros: %s', total_count)
             return total_count
         except Exception as e:
-            self._log_and_raise_error(ErrorExecution, 'Erro ao contar registros.', e)
\ No newline at end of file
+            self._log_and_raise_error(ErrorExecution, 'Erro ao contar registros.', e)
+
+
+# Um único evento para todos os serviços, em vez de um por serviço a cada instrução executada pelo ORM
+event.listen(Session, 'do_orm_execute', BaseService._on_orm_execute)
\ No newline at end of file
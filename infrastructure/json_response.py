@@ -0,0 +1,141 @@
+from flask import Response, has_request_context, request
+from typing import Any, Iterable, Iterator
+import gzip
+import orjson
+import ormsgpack
+import zlib
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+GZIP_MIN_SIZE = 4096  # Corpos menores que isso são enviados sem compressão
+GZIP_LEVEL = 1  # Nível mais barato em CPU, que ainda reduz bastante o JSON repetitivo das listas
+STREAM_CHUNK_SIZE = 65536  # Tamanho mínimo de cada pedaço enviado nas respostas em streaming
+
+def wants_msgpack() -> bool:
+    """
+    Indica se o cliente da requisição atual prefere receber a resposta em MessagePack.
+
+    A negociação usa o cabeçalho `Accept`; o JSON continua sendo o formato padrão, escolhido também
+    quando os dois formatos são aceitos com a mesma preferência ou quando não há requisição em andamento.
+
+    Returns:
+        bool: True se 'application/msgpack' for o formato preferido pelo cliente.
+    """
+    if not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match([JSON_MIMETYPE, MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+
+def make_body_response(body: bytes, status: int = 200, mimetype: str = JSON_MIMETYPE) -> Response:
+    """
+    Cria uma resposta HTTP com um corpo já serializado, comprimindo-o com gzip quando vale a pena.
+
+    A compressão é aplicada quando o corpo tem mais de `GZIP_MIN_SIZE` bytes e o cliente aceita gzip
+    (`Accept-Encoding`). O cabeçalho `Vary` informa aos caches que a resposta depende dos cabeçalhos
+    `Accept` e `Accept-Encoding`.
+
+    Args:
+        body (bytes): O corpo da resposta.
+        status (int): O status HTTP da resposta. O padrão é 200.
+        mimetype (str): O mimetype do corpo. O padrão é 'application/json'.
+
+    Returns:
+        Response: A resposta com o corpo, comprimido ou não.
+    """
+    compress = len(body) > GZIP_MIN_SIZE and has_request_context() and request.accept_encodings['gzip'] > 0
+    if compress:
+        body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+    response = Response(body, status=status, mimetype=mimetype)
+    if compress:
+        response.content_encoding = 'gzip'
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    return response
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Comprime incrementalmente os pedaços de um corpo em streaming, no formato gzip.
+
+    Args:
+        chunks (Iterable[bytes]): Os pedaços do corpo, ainda não comprimidos.
+
+    Yields:
+        bytes: Os pedaços comprimidos, omitindo os vazios.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31: cabeçalho e rodapé gzip
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def make_stream_response(chunks: Iterable[bytes], status: int = 200, mimetype: str = JSON_MIMETYPE) -> Response:
+    """
+    Cria uma resposta HTTP cujo corpo é enviado em pedaços, à medida que é gerado.
+
+    Como o tamanho total não é conhecido de antemão, a resposta não tem `Content-Length` e, quando o
+    cliente aceita gzip, é sempre comprimida, pedaço a pedaço. O iterador deve ser envolvido por
+    `stream_with_context` quando depender da requisição ou da sessão do banco.
+
+    Args:
+        chunks (Iterable[bytes]): Os pedaços do corpo.
+        status (int): O status HTTP da resposta. O padrão é 200.
+        mimetype (str): O mimetype do corpo. O padrão é 'application/json'.
+
+    Returns:
+        Response: A resposta em streaming, comprimida ou não.
+    """
+    compress = has_request_context() and request.accept_encodings['gzip'] > 0
+    response = Response(_gzip_chunks(chunks) if compress else chunks, status=status, mimetype=mimetype)
+    if compress:
+        response.content_encoding = 'gzip'
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    return response
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Converte, durante a serialização, os objetos que o orjson e o ormsgpack não conhecem.
+
+    Dataclasses (como a `Page`) são serializadas nativamente pelos encoders; apenas os objetos com
+    `to_dict` (as entidades) chegam aqui e são convertidos pelo próprio método.
+
+    Raises:
+        TypeError: Se o objeto não tiver `to_dict`.
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f'Objeto do tipo {type(obj).__name__} não é serializável')
+    return to_dict()
+
+def dumps_json(payload: Any) -> bytes:
+    """
+    Serializa o payload em JSON pelo orjson, com as mesmas opções de `make_json_response`.
+
+    Args:
+        payload (Any): Os dados a serem serializados.
+
+    Returns:
+        bytes: O JSON serializado.
+    """
+    return orjson.dumps(payload, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+def make_json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Cria uma resposta HTTP com o payload serializado em JSON pelo orjson.
+
+    Diferente do `jsonify`, os bytes gerados pelo orjson são usados diretamente no corpo da
+    resposta, sem a conversão intermediária para `str` e a recodificação para bytes. Quando o
+    cliente prefere MessagePack (`Accept: application/msgpack`), o payload é serializado pelo
+    ormsgpack, gerando um corpo menor e mais rápido de codificar.
+
+    Args:
+        payload (Any): Os dados a serem serializados (dicionários, listas, tipos simples, dataclasses
+                       e objetos com `to_dict`).
+        status (int): O status HTTP da resposta. O padrão é 200.
+
+    Returns:
+        Response: A resposta com o JSON e o mimetype 'application/json', ou com o MessagePack e o
+                  mimetype 'application/msgpack'.
+    """
+    if wants_msgpack():
+        body = ormsgpack.packb(payload, default=_encode_default, option=ormsgpack.OPT_NON_STR_KEYS)
+        return make_body_response(body, status, MSGPACK_MIMETYPE)
+    return make_body_response(dumps_json(payload), status, JSON_MIMETYPE)
\ No newline at end of file
@@ -1,33 +1,42 @@
-from infrastructure.base_model import BaseModel
-from typing import Generic, List, TypeVar
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 T = TypeVar('T')
 
-class Page(BaseModel, Generic[T]):
+@dataclass(slots=True)
+class Page(Generic[T]):
     """
     Classe que representa uma página de resultados paginados.
 
-    Esta classe armazena uma lista de itens paginados e informações de paginação, 
-    como o número da página, o tamanho da página e o total de itens.
+    Esta classe armazena uma lista de itens paginados e informações de paginação,
+    como o número da página, o tamanho da página e o total de itens. É um objeto simples
+    de transporte, com `__slots__`, sem depender do BaseModel.
 
     Atributos:
         items (List[T]): A lista de itens na página atual.
         page_number (int): O número da página atual.
         page_size (int): O número de itens por página.
-        total_items (int): O número total de itens disponíveis.
+        total_items (Optional[int]): O número total de itens disponíveis, ou `None` na paginação por cursor.
+        next_cursor (Optional[int]): ID a ser enviado como `cursor` para obter a próxima página na paginação
+                                     por cursor, ou `None` se não houver mais itens.
     """
-    
-    def __init__(self, items: List[T], page_number: int, page_size: int, total_items: int):
+    items: List[T]
+    page_number: int
+    page_size: int
+    total_items: Optional[int]
+    next_cursor: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
         """
-        Inicializa a classe Page com os itens paginados e os detalhes de paginação.
+        Converte a página em um dicionário, com cada item serializado pelo seu próprio `to_dict`.
 
-        Args:
-            items (List[T]): A lista de itens a serem exibidos nesta página.
-            page_number (int): O número da página atual.
-            page_size (int): O número de itens por página.
-            total_items (int): O número total de itens disponíveis para paginação.
+        Returns:
+            Dict[str, Any]: Representação em dicionário da página.
         """
-        self.items = items
-        self.page_number = page_number
-        self.page_size = page_size
-        self.total_items = total_items
\ No newline at end of file
+        return {
+            'items': [item.to_dict() for item in self.items],
+            'page_number': self.page_number,
+            'page_size': self.page_size,
+            'total_items': self.total_items,
+            'next_cursor': self.next_cursor
+        }
\ No newline at end of file
@@ -1,10 +1,12 @@
 from config.globals import db
+from entity.horario import Horario
 from entity.materia import Materia
 from entity.professor import Professor
 from exception.error_execution import ErrorExecution
 from infrastructure.base_repository import BaseRepository
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Dict, Any, Optional
 import logging
 
@@ -16,10 +18,18 @@ class ProfessorRepository(BaseRepository[Professor]):
     está preparada para realizar operações CRUD (Create, Read, Update, Delete)
     no modelo `Professor`.
 
+    Nas listagens, as matérias e os horários (já com as turmas) de todos os professores da página
+    são carregados por consultas IN (`selectinload`), em vez de duas consultas por professor.
+
     Args:
         BaseRepository (Generic[T]): Classe base genérica para repositórios.
     """
 
+    LIST_OPTIONS = (
+        selectinload(Professor.materias),
+        selectinload(Professor.horarios).joinedload(Horario.turma),
+    )
+
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Professor]:
         """
         Atualiza os dados de um professor existente.
@@ -31,6 +41,9 @@ class ProfessorRepository(BaseRepository[Professor]):
                 - 'materias' (List[Dict[str, int]], opcional): Lista de dicionários contendo
                   os IDs das matérias associadas ao professor. Cada dicionário deve ter a chave 'id'.
 
+        Sem a chave 'materias', apenas colunas são alteradas e a atualização segue pelo
+        `UPDATE ... RETURNING` do BaseRepository, sem carregar o professor.
+
         Retorna:
             Optional[Professor]: O objeto Professor atualizado, ou None se não for encontrado.
 
@@ -42,10 +55,13 @@ class ProfessorRepository(BaseRepository[Professor]):
         """
         if not isinstance(data, dict):
             raise TypeError("O parâmetro 'data' deve ser um dicionário")
+        if 'materias' not in data:
+            return super().update(id, data)
 
         session: Session = db.session
         try:
-            professor = session.get(Professor, id)
+            # As matérias atuais vêm junto: a atribuição abaixo não dispara um carregamento extra
+            professor = session.get(Professor, id, options=[selectinload(Professor.materias)])
             if not professor:
                 raise ErrorExecution(f"Registro com ID {id} não encontrado para atualização")
 
@@ -61,19 +77,27 @@ class ProfessorRepository(BaseRepository[Professor]):
                 if len(materia_ids) != len(data['materias']):
                     raise ValueError("Cada matéria deve ser um dicionário contendo o campo 'id'")
 
-                # Busca as matérias no banco de dados
-                materias = session.query(Materia).filter(Materia.id.in_(materia_ids)).all()
-                if len(materias) != len(materia_ids):
+                # Só as matérias que o professor ainda não tem são buscadas no banco de dados
+                materias_por_id = {materia.id: materia for materia in professor.materias}
+                faltantes = list(set(materia_ids) - materias_por_id.keys())
+                if faltantes:
+                    materias_por_id.update(
+                        (materia.id, materia)
+                        for materia in session.scalars(lambda_stmt(lambda: select(Materia).where(Materia.id.in_(faltantes))))
+                    )
+                ids_encontrados = sorted(materia_id for materia_id in set(materia_ids) if materia_id in materias_por_id)
+                if len(ids_encontrados) != len(materia_ids):
                     raise ErrorExecution("Algumas matérias fornecidas não foram encontradas")
+                materias = [materias_por_id[materia_id] for materia_id in ids_encontrados]
 
                 # Atualiza a associação de matérias do professor
                 professor.materias = materias
 
+            # Sem expirar os objetos no commit, o professor já está atualizado e dispensa o refresh
             session.commit()
-            session.refresh(professor)
             return professor
 
         except (SQLAlchemyError, ValueError, TypeError) as e:
             session.rollback()
-            logging.error(f"Erro em update do Professor: {e}")
+            logging.error("Erro em update do Professor: %s", e)
             raise ErrorExecution(e)
\ No newline at end of file
@@ -4,10 +4,12 @@ from entity.materia import Materia
 from entity.professor import Professor
 from entity.turma import Turma
 from exception.error_execution import ErrorExecution
+from exception.error_invalid_object import ErrorInvalidObject
 from infrastructure.base_repository import BaseRepository
+from sqlalchemy import delete, insert, lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Dict, Any, FrozenSet, List, Optional
 import logging
 
 class TurmaRepository(BaseRepository[Turma]):
@@ -15,12 +17,22 @@ class TurmaRepository(BaseRepository[Turma]):
     Repositório responsável pelas operações de atualização da entidade Turma no banco de dados.
     Herda de BaseRepository para fornecer métodos CRUD genéricos, e implementa um método 
     de atualização customizado.
+
+    Nas listagens, os horários de todas as turmas da página são carregados por uma única consulta
+    IN (`selectinload`), já com a matéria e o professor de cada horário.
     """
 
+    LIST_OPTIONS = (
+        selectinload(Turma.horarios).options(joinedload(Horario.materia), joinedload(Horario.professor)),
+    )
+
     def update(self, id: int, data: Dict[str, Any]) -> Optional[Turma]:
         """
         Atualiza uma instância de Turma com base nos dados fornecidos. 
         Se a turma com o ID especificado não for encontrada, uma exceção é levantada.
+
+        Sem a chave 'horarios', apenas colunas são alteradas e a atualização segue pelo
+        `UPDATE ... RETURNING` do BaseRepository, sem carregar a turma.
         
         Args:
             id (int): ID da Turma a ser atualizada.
@@ -31,8 +43,12 @@ class TurmaRepository(BaseRepository[Turma]):
         
         Raises:
             ErrorExecution: Se a turma ou os dados de professor/matéria forem inválidos.
+            ErrorInvalidObject: Se algum horário violar as restrições de verificação ou tiver uma hora inválida.
             TypeError: Se o parâmetro `data` não for um dicionário.
         """
+        if isinstance(data, dict) and 'horarios' not in data:
+            return super().update(id, data)
+
         session: Session = db.session
         try:
             if not isinstance(data, dict):
@@ -51,11 +67,19 @@ class TurmaRepository(BaseRepository[Turma]):
                 self._atualizar_horarios(session, turma, data['horarios'])
 
             session.commit()
-            session.refresh(turma)
+            # As colunas da turma já estão atualizadas em memória; apenas os horários, substituídos
+            # pelo Core, são descartados, em vez de recarregar a turma inteira com um refresh
+            session.expire(turma, ['horarios'])
             return turma
-        except (SQLAlchemyError, ValueError, TypeError) as e:
+        except ErrorInvalidObject:
+            session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            session.rollback()
+            self._raise_execution_error(e, 'update da Turma')
+        except (ValueError, TypeError) as e:
             session.rollback()
-            logging.error(f"Erro em update da Turma: {str(e)}")
+            logging.error("Erro em update da Turma: %s", e)
             raise ErrorExecution(e)
 
     def _atualizar_horarios(self, session: Session, turma: Turma, horarios_data: list) -> None:
@@ -63,6 +87,11 @@ class TurmaRepository(BaseRepository[Turma]):
         Atualiza a lista de horários de uma turma. Primeiro limpa todos os horários existentes 
         e depois adiciona os novos horários fornecidos.
 
+        Os professores (já com as suas matérias) e as matérias de todos os horários são carregados
+        antes do laço, com uma consulta por entidade, em vez de duas buscas por horário. Depois de
+        validados, os horários são substituídos por um único DELETE e um INSERT em lote, sem passar
+        pela coleção `turma.horarios`, que é expirada após o commit e recarregada quando acessada.
+
         Args:
             session (Session): Sessão atual do banco de dados.
             turma (Turma): Instância da turma a ser atualizada.
@@ -70,31 +99,77 @@ class TurmaRepository(BaseRepository[Turma]):
         
         Raises:
             ErrorExecution: Se os dados de professor ou matéria forem inválidos.
+            ErrorInvalidObject: Se algum horário violar as restrições de verificação do Horario.
+        """
+        rows = []
+        if horarios_data:
+            rows = self._montar_horarios(session, turma, horarios_data)
+        # O INSERT em lote não passa pelo repositório de horários: as restrições de verificação
+        # (como o dia da semana) são validadas aqui, antes de remover os horários atuais
+        for row in rows:
+            self.check_constraints(Horario, row)
+
+        # Remove todos os horários antigos da turma e insere os novos
+        session.execute(delete(Horario).where(Horario.turma_id == turma.id))
+        if rows:
+            session.execute(insert(Horario), rows)
+
+    def _montar_horarios(self, session: Session, turma: Turma, horarios_data: list) -> List[Dict[str, Any]]:
         """
-        # Remove todos os horários antigos da turma
-        turma.horarios.clear()
+        Valida os horários fornecidos e monta as linhas a serem inseridas na tabela de horários.
 
-        # Adiciona novos horários com base nos dados fornecidos
+        Args:
+            session (Session): Sessão atual do banco de dados.
+            turma (Turma): Instância da turma a ser atualizada.
+            horarios_data (list): Lista de dados contendo os novos horários para a turma.
+
+        Returns:
+            List[Dict[str, Any]]: Os valores das colunas de cada novo horário.
+
+        Raises:
+            ErrorExecution: Se os dados de professor ou matéria forem inválidos.
+        """
+        professor_ids = list({horario_data['professor']['id'] for horario_data in horarios_data})
+        materia_ids = list({horario_data['materia']['id'] for horario_data in horarios_data})
+        # Consultas por lambda: o SQL compilado é reaproveitado e só a lista de IDs muda a cada chamada
+        professores = {
+            professor.id: professor
+            for professor in session.scalars(lambda_stmt(
+                lambda: select(Professor).options(selectinload(Professor.materias)).where(Professor.id.in_(professor_ids))
+            ))
+        }
+        materias = {
+            materia.id: materia
+            for materia in session.scalars(lambda_stmt(lambda: select(Materia).where(Materia.id.in_(materia_ids))))
+        }
+        # IDs das matérias de cada professor, montados uma vez para verificar o vínculo de cada horário em O(1)
+        materias_por_professor = {
+            professor.id: frozenset(materia.id for materia in professor.materias)
+            for professor in professores.values()
+        }
+
+        rows = []
         for horario_data in horarios_data:
-            professor, materia = self._buscar_professor_e_materia(session, horario_data)
-            
-            # Cria uma nova instância de Horario e a adiciona à turma
-            novo_horario = Horario(
-                dia_da_semana=horario_data['dia_da_semana'],
-                hora=horario_data['hora'],
-                professor=professor,
-                materia=materia,
-                turma=turma
-            )
-            turma.horarios.append(novo_horario)
-
-    def _buscar_professor_e_materia(self, session: Session, horario_data: Dict[str, Any]) -> tuple:
+            professor, materia = self._buscar_professor_e_materia(professores, materias, materias_por_professor, horario_data)
+            rows.append({
+                'dia_da_semana': horario_data['dia_da_semana'],
+                'hora': horario_data['hora'],
+                'professor_id': professor.id,
+                'materia_id': materia.id,
+                'turma_id': turma.id
+            })
+        return rows
+
+    def _buscar_professor_e_materia(self, professores: Dict[int, Professor], materias: Dict[int, Materia],
+                                    materias_por_professor: Dict[int, FrozenSet[int]], horario_data: Dict[str, Any]) -> tuple:
         """
-        Busca e valida a instância do professor e da matéria com base nos dados fornecidos. 
+        Obtém e valida a instância do professor e da matéria com base nos dados fornecidos. 
         Verifica se o professor existe e se a matéria está vinculada ao professor.
 
         Args:
-            session (Session): Sessão atual do banco de dados.
+            professores (Dict[int, Professor]): Professores já carregados, indexados pelo ID.
+            materias (Dict[int, Materia]): Matérias já carregadas, indexadas pelo ID.
+            materias_por_professor (Dict[int, FrozenSet[int]]): IDs das matérias vinculadas a cada professor.
             horario_data (Dict[str, Any]): Dados do horário contendo IDs de professor e matéria.
         
         Returns:
@@ -105,17 +180,17 @@ class TurmaRepository(BaseRepository[Turma]):
                             não estiver vinculada ao professor.
         """
         professor_id = horario_data['professor']['id']
-        professor = session.get(Professor, professor_id)
+        professor = professores.get(professor_id)
         if not professor:
             raise ErrorExecution(f"Professor com ID {professor_id} não encontrado")
 
         materia_id = horario_data['materia']['id']
-        materia = session.get(Materia, materia_id)
+        materia = materias.get(materia_id)
         if not materia:
             raise ErrorExecution(f"Matéria com ID {materia_id} não encontrada")
 
         # Verificar se a matéria está vinculada ao professor
-        if materia not in professor.materias:
+        if materia_id not in materias_por_professor[professor_id]:
             raise ErrorExecution(f"A matéria '{materia.nome}' não está vinculada ao professor '{professor.nome}'")
 
         return professor, materia
\ No newline at end of file